@@ -1,32 +1,51 @@
 # src/parsers/enhanced_parser.py
 
 # Standard library imports
+import collections
+import functools
+import gc
+import hashlib
 import logging
 import os
 import re
 import json
+import threading
+import time
 from concurrent.futures import (
+    Future,
     ThreadPoolExecutor,
     TimeoutError as ConcurrentTimeoutError,
+    as_completed,
 )
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 # Third-party imports
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; fall back to per-value substring search
+    ahocorasick = None
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
 import torch
 from huggingface_hub import login
 from PIL import Image
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process
 from transformers import DonutProcessor, VisionEncoderDecoderModel, pipeline
+from transformers.modeling_outputs import BaseModelOutput
 
 # Local imports
 from src.parsers.base_parser import BaseParser
 from src.parsers.data_merger import DataMerger, MergeChange
 from src.parsers.parser_helpers import (
     format_date,
+    parse_date,
     format_phone_number,
     clean_text,
     format_address,
 )
+from src.parsers.stages.batching import close_pipeline, wrap_pipeline
 from src.parsers.stages.post_processing import post_process_parsed_data
 from src.utils.config_loader import ConfigLoader
 from src.utils.quickbase_schema import QUICKBASE_SCHEMA
@@ -35,6 +54,236 @@ from src.utils.validation import validate_json, assignment_schema
 # Constants
 LLM_TIMEOUT_SECONDS = 500
 VALIDATION_TIMEOUT_SECONDS = 60  # Added a specific timeout for validation
+# BART reads at most 1024 tokens; leave room for the prompt around the email.
+VALIDATION_MAX_EMAIL_TOKENS = 768
+DONUT_MAX_NEW_TOKENS = 256
+# Swin encoder outputs kept for documents that are parsed again (retries, re-runs).
+DONUT_ENCODER_CACHE_SIZE = 32
+
+
+# Field classifiers for _stage_post_processing_internal.
+_BOOL_FIELDS = frozenset(
+    {
+        "Wind",
+        "Structural",
+        "Hail",
+        "Foundation",
+        "Residence Occupied During Loss",
+        "Was Someone home at time of damage",
+    }
+)
+_PHONE_TERMS = ("Contact #", "Phone Number", "Phone")
+_POST_PROCESSING_SKIP_SECTIONS = frozenset(
+    {
+        "TransformerEntities",
+        "Entities",
+        "missing_fields",
+        "inconsistent_fields",
+        "user_notifications",
+        "validation_issues",
+    }
+)
+
+def _dumps_compact(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Keywords that make an NER entity relevant, by entity label.
+_NER_RELEVANCE_KEYWORDS = {
+    "PER": ("insured", "adjuster", "handler", "public adjuster"),
+    "ORG": ("insurance company", "claims adjuster"),
+    "LOC": ("loss location", "property", "address"),
+    "GPE": ("loss location", "property", "address"),
+    "DATE": ("loss", "incident", "damage"),
+    "EVENT": ("loss", "incident", "damage"),
+}
+# Label -> ordered (keyword, (section, field)) rules; the first keyword present wins.
+_NER_FIELD_RULES = {
+    "PER": (
+        ("insured", ("Insured Information", "Name")),
+        ("adjuster", ("Adjuster Information", "Adjuster Name")),
+        ("handler", ("Requesting Party", "Handler")),
+        ("public adjuster", ("Insured Information", "Public Adjuster")),
+    ),
+    "ORG": (
+        ("insurance company", ("Requesting Party", "Insurance Company")),
+        ("claims adjuster", ("Adjuster Information", "Job Title")),
+    ),
+    "LOC": (
+        ("loss location", ("Insured Information", "Loss Address")),
+        ("address", ("Adjuster Information", "Address")),
+    ),
+    "DATE": (
+        ("loss", ("Assignment Information", "Date of Loss/Occurrence")),
+        ("incident", ("Assignment Information", "Date of Loss/Occurrence")),
+        ("damage", ("Assignment Information", "Cause of loss")),
+    ),
+    "PHONE": (
+        ("contact number", ("Insured Information", "Contact #")),
+        ("adjuster phone", ("Adjuster Information", "Adjuster Phone Number")),
+    ),
+}
+_NER_FIELD_RULES["GPE"] = _NER_FIELD_RULES["LOC"]
+_NER_FIELD_RULES["EVENT"] = _NER_FIELD_RULES["DATE"]
+
+_NER_KEYWORDS = frozenset(
+    [keyword for keywords in _NER_RELEVANCE_KEYWORDS.values() for keyword in keywords]
+    + [keyword for rules in _NER_FIELD_RULES.values() for keyword, _ in rules]
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _ner_keyword_hits(email_content: str) -> frozenset:
+    """The NER context keywords that occur in the email; lowercased once per email."""
+    lowered = email_content.lower()
+    return frozenset(keyword for keyword in _NER_KEYWORDS if keyword in lowered)
+
+
+# Donut form field name -> (section, QuickBase field).
+_DONUT_FIELD_MAPPING = {
+    "policy_number": ("Adjuster Information", "Policy #"),
+    "claim_number": ("Requesting Party", "Carrier Claim Number"),
+    "insured_name": ("Insured Information", "Name"),
+    "loss_address": ("Insured Information", "Loss Address"),
+    "adjuster_name": ("Adjuster Information", "Adjuster Name"),
+    "adjuster_phone": ("Adjuster Information", "Adjuster Phone Number"),
+    "adjuster_email": ("Adjuster Information", "Adjuster Email"),
+    "date_of_loss": ("Assignment Information", "Date of Loss/Occurrence"),
+    "cause_of_loss": ("Assignment Information", "Cause of loss"),
+    "loss_description": ("Assignment Information", "Loss Description"),
+    "inspection_type": ("Assignment Information", "Inspection type"),
+    "repair_progress": (
+        "Assignment Information",
+        "Repair or Mitigation Progress",
+    ),
+    "residence_occupied": (
+        "Assignment Information",
+        "Residence Occupied During Loss",
+    ),
+    "someone_home": (
+        "Assignment Information",
+        "Was Someone home at time of damage",
+    ),
+    "type": ("Assignment Information", "Type"),
+    "additional_instructions": (
+        "Additional details/Special Instructions",
+        "Details",
+    ),
+    "attachments": ("Attachment(s)", "Files"),
+    "owner_tenant": (
+        "Insured Information",
+        "Is the insured an Owner or a Tenant of the loss location?",
+    ),
+}
+_DONUT_BOOL_FIELDS = frozenset({"residence_occupied", "someone_home"})
+# Strings post-processing reads as True for boolean fields.
+_POST_PROCESSING_TRUE_VALUES = frozenset({"yes", "true"})
+
+@functools.lru_cache(maxsize=None)
+def _stage_key(stage_name: str) -> str:
+    """Config key for a stage display name, e.g. "NER Parsing" -> "ner_parsing"."""
+    return stage_name.lower().replace(" ", "_")
+
+
+# Shared read-only default for missing sections; never mutated.
+_EMPTY: Dict[str, Any] = {}
+_SCHEMA_VALIDATION_SKIP_SECTIONS = frozenset(
+    {
+        "Entities",
+        "TransformerEntities",
+        "missing_fields",
+        "inconsistent_fields",
+        "user_notifications",
+        "validation_issues",
+    }
+)
+
+_JSON_BLOCK_RE = re.compile(r"<BEGIN JSON>(.*?)<END JSON>", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+# _clean_text: underscore rules and [cid:...] image refs are dropped, repeated
+# sentence punctuation collapses to its first character.
+_CLEAN_TEXT_RE = re.compile(r"_{2,}|\[cid:[^\]]+\]|([.!?])\1+")
+_ADDRESS_COMMA_RE = re.compile(r"\s*,\s*")
+# Trailing two-letter state, optionally followed by a ZIP / ZIP+4.
+_ADDRESS_STATE_RE = re.compile(r"\b([A-Za-z]{2})\b\s*(\d{5}(?:-\d{4})?)?$")
+_ATTACHED_RE = re.compile(r"attached\s+([\w\s.,]+)", re.IGNORECASE)
+_QUOTE_TABLE = str.maketrans({"\u201c": '"', "\u201d": '"'})
+
+# Prompt used by EnhancedParser.validate_with_bart. Filled per section with
+# str.format_map so the template is not rebuilt on every call.
+_VALIDATION_PROMPT_TEMPLATE = """\
+Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
+
+Section: {section}
+Parsed Data: {parsed}
+Email Content: {email}
+
+Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
+
+<BEGIN JSON>
+{{
+    "suggestions": {{
+{suggestions}    }}
+}}
+<END JSON>
+"""
+
+# Example suggestion per expected field; only fields that are still missing are
+# put in front of the validation model.
+FIELD_SUGGESTIONS: Dict[str, Dict[str, str]] = {
+    "Requesting Party": {
+        "Insurance Company": "Ensure the company name is spelled correctly.",
+        "Handler": "Provide contact information if missing.",
+        "Carrier Claim Number": "Verify the format of the claim number.",
+    },
+    "Insured Information": {
+        "Name": "Ensure the insured's name is complete and correctly spelled.",
+        "Contact #": "Verify the contact number format.",
+        "Loss Address": "Confirm the completeness of the loss address.",
+        "Public Adjuster": "Provide contact details if missing.",
+        "Is the insured an Owner or a Tenant of the loss location?": "Confirm the ownership status.",
+    },
+    "Adjuster Information": {
+        "Adjuster Name": "Ensure the adjuster's name is correctly spelled.",
+        "Adjuster Phone Number": "Verify the phone number format.",
+        "Adjuster Email": "Confirm the email format is valid.",
+        "Job Title": "Provide the adjuster's job title if missing.",
+        "Address": "Ensure the address is complete and correctly formatted.",
+        "Policy #": "Check if the policy number follows the required pattern.",
+    },
+    "Assignment Information": {
+        "Date of Loss/Occurrence": "Ensure the date follows the YYYY-MM-DD format.",
+        "Cause of loss": "Specify the exact cause of the loss.",
+        "Facts of Loss": "Provide detailed facts related to the loss.",
+        "Loss Description": "Ensure the description is comprehensive.",
+        "Residence Occupied During Loss": "Confirm whether the residence was occupied.",
+        "Was Someone home at time of damage": "Specify if someone was present during the damage.",
+        "Repair or Mitigation Progress": "Update the current status of repairs or mitigation.",
+        "Type": "Clarify the type of loss or damage.",
+        "Inspection type": "Specify the type of inspection conducted.",
+    },
+    "Assignment Type": {
+        "Wind": "Confirm if wind-related damage is applicable.",
+        "Structural": "Verify if structural damage is present.",
+        "Hail": "Check for any hail-related issues.",
+        "Foundation": "Ensure foundation damage is assessed.",
+        "Other": "Provide details for any other types of damage.",
+    },
+    "Additional details/Special Instructions": {
+        "Additional details/Special Instructions": "Ensure all special instructions are clearly stated.",
+    },
+    "Attachment(s)": {
+        "Attachment(s)": "Verify that all mentioned attachments are included and accessible.",
+    },
+}
 
 
 # Exceptions
@@ -113,6 +362,34 @@ class DataMerger:
 
 
 class EnhancedParser(BaseParser):
+    # Stages that read only the raw inputs; they start together at the top of
+    # parse() while the later stages wait on the merged result.
+    INDEPENDENT_STAGES = frozenset({"NER Parsing", "Donut Parsing"})
+    # Stage key -> method that reinitializes its model. Post processing and JSON
+    # validation have no model to recover.
+    _RECOVERY_METHODS = {
+        "ner_parsing": "init_ner",
+        "donut_parsing": "init_donut",
+        "validation_parsing": "init_validation_model",
+        "schema_validation": "init_validation_model",
+        "summarization": "init_summarization_model",
+    }
+    # (model attribute, display name) pairs that cleanup_resources moves off the GPU.
+    _CLEANUP_MODELS = (
+        ("donut_model", "Donut model"),
+        ("ner_pipeline", "NER pipeline"),
+        ("validation_pipeline", "Validation pipeline"),
+        ("summarization_pipeline", "Summarization pipeline"),
+    )
+    # Recoverable stage key -> model attribute its init method loads.
+    _RECOVERY_COMPONENTS = {
+        "ner_parsing": "ner_pipeline",
+        "donut_parsing": "donut_model",
+        "validation_parsing": "validation_pipeline",
+        "schema_validation": "validation_pipeline",
+        "summarization": "summarization_pipeline",
+    }
+
     def __init__(
         self,
         socketio: Optional[Any] = None,
@@ -133,16 +410,52 @@ class EnhancedParser(BaseParser):
         try:
             self.config = ConfigLoader.load_config()
             self.logger.debug("Loaded configuration: %s", self.config)
+            # CORD-style form JSON ends well before the decoder's position limit.
+            self.donut_max_new_tokens = self.config.get(
+                "donut_max_new_tokens", DONUT_MAX_NEW_TOKENS
+            )
+            # Emails repeat the same dates/phones/addresses across sections.
+            self._format_date_cached = functools.lru_cache(maxsize=2048)(
+                self.format_date
+            )
+            self._format_phone_number_cached = functools.lru_cache(maxsize=2048)(
+                self.format_phone_number
+            )
+            self._format_address_cached = functools.lru_cache(maxsize=2048)(
+                self._format_address
+            )
+            self._known_values_lower = {
+                field: [known.lower() for known in values]
+                for field, values in self.config.get("known_values", {}).items()
+            }
             self._check_environment_variables()
+            # Runs each parse stage under its timeout; created on first use by
+            # _ensure_stage_executor and shared by later parses.
+            self._stage_executor: Optional[ThreadPoolExecutor] = None
+            self._stage_executor_lock = threading.Lock()
+            # Stage name -> future of a run that timed out while still running.
+            self._stalled_stages: Dict[str, Future] = {}
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
             self.logger.info("Using device: %s", self.device)
-            self.init_ner()
-            self.init_donut()
-            self.init_validation_model()
-            self.init_summarization_model()
+            # Models load on first use (see _lazy_load_*), so text-only parses
+            # never pay for Donut and unused stages never allocate VRAM.
+            self.ner_pipeline = None
+            self.donut_model = None
+            self.donut_processor = None
+            self.validation_pipeline = None
+            self.summarization_pipeline = None
+            self._model_load_lock = threading.Lock()
             self.socketio = socketio
             self.sid = sid
             self.timeouts = self._set_timeouts()
+            # Flattened (section, field, required) view of the schema for parse_email.
+            self._flat_schema = [
+                (section, field, cfg.get("required", False))
+                for section, fields in QUICKBASE_SCHEMA.items()
+                if isinstance(fields, dict)
+                for field, cfg in fields.items()
+                if isinstance(cfg, dict) and "field_id" in cfg
+            ]
             self.logger.info("EnhancedParser initialized successfully.")
         except (ValueError, OSError) as e:
             self.logger.error(
@@ -154,11 +467,19 @@ class EnhancedParser(BaseParser):
         try:
             self.logger.info("Initializing Text Summarization Model pipeline.")
             repo_id = "facebook/bart-large-cnn"
+            # Stop the batching thread of the pipeline being replaced.
+            close_pipeline(getattr(self, "summarization_pipeline", None))
             self.summarization_pipeline = pipeline(
                 "summarization",
                 model=repo_id,
                 tokenizer=repo_id,
                 device=0 if self.device == "cuda" else -1,
+                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
+            )
+            self.summarization_pipeline.model.eval()
+            # Concurrent parses share one forward pass instead of one each.
+            self.summarization_pipeline = wrap_pipeline(
+                self.summarization_pipeline, self.logger, self.config.get("batching")
             )
             self.logger.info("Loaded Summarization Model '%s' successfully.", repo_id)
         except (OSError, ValueError) as e:
@@ -171,6 +492,7 @@ class EnhancedParser(BaseParser):
         try:
             self.logger.info("Initializing NER pipeline.")
             repo_id = "dslim/bert-base-NER"
+            close_pipeline(getattr(self, "ner_pipeline", None))
             self.ner_pipeline = pipeline(
                 "ner",
                 model=repo_id,
@@ -178,6 +500,15 @@ class EnhancedParser(BaseParser):
                 aggregation_strategy="simple",
                 device=0 if self.device == "cuda" else -1,
             )
+            # Single-window emails from concurrent parses are batched together;
+            # multi-window emails are already passed as one list.
+            self.ner_pipeline = wrap_pipeline(
+                self.ner_pipeline, self.logger, self.config.get("batching")
+            )
+            # BERT-base tops out at 512 tokens; longer emails are split into
+            # overlapping windows of this many tokens.
+            self._ner_max_tokens = 384
+            self._ner_stride = 64
             self.logger.info("Loaded NER model '%s' successfully.", repo_id)
         except (OSError, ValueError) as e:
             self.logger.error(
@@ -192,10 +523,54 @@ class EnhancedParser(BaseParser):
             self.donut_processor = DonutProcessor.from_pretrained(
                 repo_id, cache_dir=".cache"
             )
-            self.donut_model = VisionEncoderDecoderModel.from_pretrained(
-                repo_id, cache_dir=".cache"
-            )
-            self.donut_model.to(self.device)
+            # BF16 halves activation traffic on GPUs that support it without the
+            # FP16 overflow risk; CPU stays in FP32.
+            if self.device == "cuda":
+                dtype = (
+                    torch.bfloat16
+                    if torch.cuda.is_bf16_supported()
+                    else torch.float16
+                )
+            else:
+                dtype = torch.float32
+            try:
+                self.donut_model = VisionEncoderDecoderModel.from_pretrained(
+                    repo_id,
+                    cache_dir=".cache",
+                    torch_dtype=dtype,
+                    attn_implementation="sdpa",
+                )
+            except ValueError:
+                # Not every encoder/decoder pair supports SDPA attention.
+                self.donut_model = VisionEncoderDecoderModel.from_pretrained(
+                    repo_id, cache_dir=".cache", torch_dtype=dtype
+                )
+            self.donut_model.to(self.device).eval()
+            if (
+                self.device == "cuda"
+                and self.config.get("compile_donut", False)
+                and hasattr(torch, "compile")
+            ):
+                # The processor resizes every page to one shape, so the encoder
+                # compiles once and replays as a CUDA graph.
+                self.donut_model.encoder.forward = torch.compile(
+                    self.donut_model.encoder.forward,
+                    mode="reduce-overhead",
+                    fullgraph=False,
+                )
+                self.logger.debug("Donut encoder compiled with torch.compile.")
+                # Decoder steps only have a fixed shape with a static KV cache;
+                # with the dynamic cache every step would trigger a recompile.
+                if getattr(self.donut_model, "_supports_static_cache", False):
+                    self.donut_model.generation_config.cache_implementation = "static"
+                    self.donut_model.decoder.forward = torch.compile(
+                        self.donut_model.decoder.forward,
+                        mode="reduce-overhead",
+                        dynamic=False,
+                    )
+                    self.logger.debug("Donut decoder compiled with a static KV cache.")
+            # Cached encoder outputs belong to the model that produced them.
+            self._donut_encoder_cache = collections.OrderedDict()
             self.logger.info("Loaded Donut model '%s' successfully.", repo_id)
         except (OSError, ValueError) as e:
             self.logger.error(
@@ -204,6 +579,31 @@ class EnhancedParser(BaseParser):
             self.donut_model = None
             self.donut_processor = None
 
+    def _load_ort_seq2seq_pipeline(self, repo_id: str):
+        """
+        Builds a text2text pipeline on an ONNX Runtime export of ``repo_id`` when
+        ``use_onnxruntime`` is enabled and optimum is installed; otherwise None.
+        """
+        if not self.config.get("use_onnxruntime", False):
+            return None
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            from transformers import AutoTokenizer
+        except ImportError:
+            self.logger.warning(
+                "use_onnxruntime is set but optimum[onnxruntime] is not installed."
+            )
+            return None
+        provider = (
+            "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+        )
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            repo_id, export=True, provider=provider
+        )
+        tokenizer = AutoTokenizer.from_pretrained(repo_id)
+        self.logger.info("Using ONNX Runtime (%s) for '%s'.", provider, repo_id)
+        return pipeline("text2text-generation", model=model, tokenizer=tokenizer)
+
     def init_validation_model(self):
         try:
             self.logger.info("Initializing Validation Model pipeline.")
@@ -215,27 +615,39 @@ class EnhancedParser(BaseParser):
             login(token=hf_token)
             self.logger.info("Logged in to Hugging Face Hub successfully.")
             repo_id = "facebook/bart-large"
-            self.validation_pipeline = pipeline(
-                "text2text-generation",
-                model=repo_id,
-                tokenizer=repo_id,
-                device=0 if self.device == "cuda" else -1,
-            )
+            self.validation_pipeline = self._load_ort_seq2seq_pipeline(repo_id)
+            if self.validation_pipeline is None:
+                self.validation_pipeline = pipeline(
+                    "text2text-generation",
+                    model=repo_id,
+                    tokenizer=repo_id,
+                    device=0 if self.device == "cuda" else -1,
+                    torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
+                )
+                self.validation_pipeline.model.eval()
+            # Batched generation pads every prompt to the longest in the batch.
+            tokenizer = self.validation_pipeline.tokenizer
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
             self.logger.info("Loaded Validation Model '%s' successfully.", repo_id)
         except (OSError, ValueError) as e:
             self.logger.error("Failed to load Validation Model: %s", e, exc_info=True)
             self.validation_pipeline = None
 
-    def health_check(self) -> bool:
-        components_healthy = all(
-            [
-                hasattr(self, "ner_pipeline") and self.ner_pipeline is not None,
-                hasattr(self, "donut_model") and self.donut_model is not None,
-                hasattr(self, "validation_pipeline")
-                and self.validation_pipeline is not None,
-                hasattr(self, "summarization_pipeline")
-                and self.summarization_pipeline is not None,
+    def health_check(self, components: Optional[List[str]] = None) -> bool:
+        """
+        Checks that the given model attributes (all of them by default) are loaded.
+        Models load lazily, so callers that only reloaded one model pass its name.
+        """
+        if components is None:
+            components = [
+                "ner_pipeline",
+                "donut_model",
+                "validation_pipeline",
+                "summarization_pipeline",
             ]
+        components_healthy = all(
+            getattr(self, component, None) is not None for component in components
         )
         if not components_healthy:
             self.logger.error("One or more components failed to initialize.")
@@ -279,6 +691,10 @@ class EnhancedParser(BaseParser):
         self.logger.debug("Set processing timeouts: %s", timeouts)
         return timeouts
 
+    @staticmethod
+    def _record_issue(parsed_data: Dict[str, Any], message: str) -> None:
+        parsed_data.setdefault("validation_issues", []).append(message)
+
     def parse_email(
         self,
         email_content: Optional[str] = None,
@@ -292,37 +708,18 @@ class EnhancedParser(BaseParser):
             is_valid, error_message = validate_json(parsed_data)
             if not is_valid:
                 self.logger.warning(f"JSON validation failed: {error_message}")
-                parsed_data["validation_issues"] = parsed_data.get(
-                    "validation_issues", []
-                )
-                parsed_data["validation_issues"].append(error_message)
-            formatted_data = {}
+                self._record_issue(parsed_data, error_message)
+            formatted_data = collections.defaultdict(dict)
             missing_fields = []
-            for section, fields in QUICKBASE_SCHEMA.items():
-                if isinstance(fields, dict):
-                    formatted_section = {}
-                    for field, field_config in fields.items():
-                        if (
-                            isinstance(field_config, dict)
-                            and "field_id" in field_config
-                        ):
-                            section_data = parsed_data.get(section, {})
-                            value = (
-                                section_data.get(field, ["N/A"])[0]
-                                if isinstance(section_data.get(field), list)
-                                else section_data.get(field, "N/A")
-                            )
-                            if field_config.get("required", False) and (
-                                not value or value == "N/A"
-                            ):
-                                missing_fields.append(f"{section} -> {field}")
-                            formatted_data.setdefault(section, {})[field] = value
-            parsed_data["formatted_output"] = formatted_data
+            for section, field, required in self._flat_schema:
+                value = parsed_data.get(section, {}).get(field, "N/A")
+                value = value[0] if isinstance(value, list) and value else value
+                if required and (not value or value == "N/A"):
+                    missing_fields.append(f"{section} -> {field}")
+                formatted_data[section][field] = value
+            parsed_data["formatted_output"] = dict(formatted_data)
             if missing_fields:
-                parsed_data["validation_issues"] = parsed_data.get(
-                    "validation_issues", []
-                )
-                parsed_data["validation_issues"].extend(
+                parsed_data.setdefault("validation_issues", []).extend(
                     [f"Missing required field: {field}" for field in missing_fields]
                 )
             return parsed_data
@@ -336,6 +733,8 @@ class EnhancedParser(BaseParser):
         document_image: Optional[Union[str, Image.Image]] = None,
     ) -> Dict[str, Any]:
         self.logger.info("Starting parsing process.")
+        self._recover_stalled_stages()
+        stage_executor = self._ensure_stage_executor()
         parsed_data: Dict[str, Any] = {}
         stages = [
             ("NER Parsing", self._stage_ner_parsing, {"email_content": email_content}),
@@ -365,6 +764,29 @@ class EnhancedParser(BaseParser):
                 {"parsed_data": parsed_data},
             ),
         ]
+        stage_starts: Dict[str, float] = {}
+
+        def submit(stage_name, stage_method, kwargs):
+            started = threading.Event()
+
+            def run():
+                stage_starts[stage_name] = time.monotonic()
+                started.set()
+                return stage_method(**kwargs)
+
+            return stage_executor.submit(run), started
+
+        submitted = {}
+        for stage_name, stage_method, kwargs in stages:
+            if stage_name in self.INDEPENDENT_STAGES and (
+                stage_name != "Donut Parsing" or document_image
+            ):
+                submitted[stage_name] = submit(stage_name, stage_method, kwargs)
+        # Set when a sequential stage outlives its timeout; its thread keeps
+        # running, so the sequential stages that would queue behind it are skipped.
+        stalled_stage = None
+        # Results are still merged in stage order, so the output does not depend
+        # on which independent stage finishes first.
         for stage_name, stage_method, kwargs in stages:
             try:
                 if stage_name == "Donut Parsing" and not document_image:
@@ -372,22 +794,48 @@ class EnhancedParser(BaseParser):
                         "No document image provided for Donut parsing. Skipping this stage."
                     )
                     continue
+                if stalled_stage and stage_name not in submitted:
+                    self.logger.warning(
+                        "Skipping stage '%s': stage '%s' is still running past its timeout.",
+                        stage_name,
+                        stalled_stage,
+                    )
+                    continue
                 self.logger.info("Stage: %s", stage_name)
-                timeout_seconds = self.timeouts.get(
-                    stage_name.lower().replace(" ", "_"), 60
+                timeout_seconds = self.timeouts.get(_stage_key(stage_name), 60)
+                if stage_name in submitted:
+                    future, started = submitted[stage_name]
+                else:
+                    future, started = submit(stage_name, stage_method, kwargs)
+                # The timeout runs from when the stage starts, not from when it was
+                # queued behind other stages; waiting to start is bounded separately.
+                if not started.wait(timeout_seconds) and future.cancel():
+                    self.logger.error(
+                        "Stage '%s' did not start within %d seconds.",
+                        stage_name,
+                        timeout_seconds,
+                    )
+                    continue
+                remaining = (
+                    stage_starts.get(stage_name, time.monotonic())
+                    + timeout_seconds
+                    - time.monotonic()
                 )
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(stage_method, **kwargs)
-                    stage_result = future.result(timeout=timeout_seconds)
+                stage_result = future.result(timeout=max(0.0, remaining))
                 if isinstance(stage_result, dict) and stage_result:
                     parsed_data = self.merge_parsed_data(parsed_data, stage_result)
             except ConcurrentTimeoutError:
+                # A running future cannot be cancelled. Reloading the model now
+                # would swap it out from under that thread, so recovery waits
+                # until the stage has finished (see _recover_stalled_stages).
                 self.logger.error(
                     "Stage '%s' timed out after %d seconds.",
                     stage_name,
                     timeout_seconds,
                 )
-                self.recover_from_failure(stage_name)
+                self._stalled_stages[stage_name] = future
+                if stage_name not in submitted:
+                    stalled_stage = stage_name
             except Exception as e:
                 self.logger.error(
                     "Error in stage '%s': %s", stage_name, e, exc_info=True
@@ -395,6 +843,25 @@ class EnhancedParser(BaseParser):
         self.logger.info("Parsing process completed.")
         return parsed_data
 
+    def _recover_stalled_stages(self) -> None:
+        # Recover stages whose timed-out run has since returned; the ones still
+        # running keep using their model.
+        for stage_name, future in list(self._stalled_stages.items()):
+            if future.done() and self._stalled_stages.pop(stage_name, None) is future:
+                self.recover_from_failure(stage_name)
+
+    def _ensure_stage_executor(self) -> ThreadPoolExecutor:
+        # cleanup_resources shuts the pool down; the next parse starts a new one.
+        with self._stage_executor_lock:
+            if self._stage_executor is None:
+                # One worker per pre-submitted independent stage, plus one so the
+                # sequential stages never queue behind them.
+                self._stage_executor = ThreadPoolExecutor(
+                    max_workers=len(self.INDEPENDENT_STAGES) + 1,
+                    thread_name_prefix="parse-stage",
+                )
+            return self._stage_executor
+
     def _stage_ner_parsing(self, email_content: Optional[str] = None) -> Dict[str, Any]:
         if not email_content:
             self.logger.warning("No email content provided for NER Parsing.")
@@ -462,13 +929,14 @@ class EnhancedParser(BaseParser):
             return
         self.logger.debug("Executing Text Summarization stage.")
         try:
+            self._lazy_load_summarization_model()
             if self.summarization_pipeline is None:
                 self.logger.warning(
                     "Summarization pipeline is not available. Skipping Text Summarization."
                 )
                 return
             summary = self.summarization_pipeline(
-                email_content, max_length=150, min_length=50, do_sample=False
+                email_content, max_length=150, min_length=50, do_sample=False, num_beams=1
             )
             if summary:
                 parsed_data["summary"] = summary[0].get("summary_text", "")
@@ -513,224 +981,265 @@ class EnhancedParser(BaseParser):
 
     def ner_parsing(self, email_content: str) -> Dict[str, Any]:
         try:
+            hits = _ner_keyword_hits(email_content)
+            if not hits:
+                # is_relevant_entity would reject every entity; skip the model.
+                self.logger.debug("No NER context keywords in email; skipping NER.")
+                return {}
             self.logger.debug("Starting NER pipeline.")
-            entities = self.ner_pipeline(email_content)
-            extracted_entities: Dict[str, Any] = {}
+            entities = self._run_ner_windows(email_content)
+            extracted_entities = collections.defaultdict(
+                lambda: collections.defaultdict(list)
+            )
+            debug = self.logger.isEnabledFor(logging.DEBUG)
             for entity in entities:
-                if self.is_relevant_entity(entity, email_content):
-                    section, field = self.map_entity_to_field(entity, email_content)
+                label = entity.get("entity_group")
+                if self.is_relevant_entity(label, hits):
+                    section, field = self.map_entity_to_field(label, hits)
                     if section and field:
-                        extracted_entities.setdefault(section, {}).setdefault(
-                            field, []
-                        ).append(entity.get("word").strip())
-                        self.logger.debug(
-                            "Extracted entity '%s' mapped to %s - %s",
-                            entity.get("word"),
-                            section,
-                            field,
-                        )
-            return extracted_entities
+                        word = entity.get("word")
+                        extracted_entities[section][field].append(word.strip())
+                        if debug:
+                            self.logger.debug(
+                                "Extracted entity '%s' mapped to %s - %s",
+                                word,
+                                section,
+                                field,
+                            )
+            return {
+                section: dict(fields)
+                for section, fields in extracted_entities.items()
+            }
         except Exception as e:
             self.logger.error("Error during NER parsing: %s", e, exc_info=True)
             return {}
 
-    def is_relevant_entity(self, entity, email_content) -> bool:
-        label = entity.get("entity_group")
-        text = entity.get("word")
-        if label == "PER":
-            patterns = [
-                r"insured",
-                r"adjuster",
-                r"handler",
-                r"public adjuster",
-            ]
-        elif label == "ORG":
-            patterns = [
-                r"insurance company",
-                r"claims adjuster",
-            ]
-        elif label in ["LOC", "GPE"]:
-            patterns = [
-                r"loss location",
-                r"property",
-                r"address",
-            ]
-        elif label in ["DATE", "EVENT"]:
-            patterns = [
-                r"loss",
-                r"incident",
-                r"damage",
-            ]
-        elif label in ["PHONE", "EMAIL"]:
-            patterns = []
-        else:
-            patterns = []
-        for pattern in patterns:
-            if re.search(pattern, email_content, re.IGNORECASE):
-                return True
-        return False
+    def _run_ner_windows(self, email_content: str) -> List[Dict[str, Any]]:
+        encoding = self.ner_pipeline.tokenizer(
+            email_content,
+            max_length=self._ner_max_tokens,
+            stride=self._ner_stride,
+            truncation=True,
+            return_overflowing_tokens=True,
+            return_offsets_mapping=True,
+            add_special_tokens=False,
+        )
+        windows = []
+        for offsets in encoding["offset_mapping"]:
+            if offsets:
+                windows.append((offsets[0][0], offsets[-1][1]))
+        if len(windows) <= 1:
+            return self.ner_pipeline(email_content)
+        self.logger.debug("Running NER over %d overlapping windows.", len(windows))
+        texts = [email_content[start:end] for start, end in windows]
+        window_results = self.ner_pipeline(texts, batch_size=len(texts))
+        entities = []
+        seen = set()
+        for (window_start, _), window_entities in zip(windows, window_results):
+            for entity in window_entities:
+                entity = dict(entity)
+                entity["start"] = entity.get("start", 0) + window_start
+                entity["end"] = entity.get("end", 0) + window_start
+                key = (entity["start"], entity["end"], entity.get("entity_group"))
+                if key not in seen:
+                    seen.add(key)
+                    entities.append(entity)
+        return entities
+
+    def is_relevant_entity(self, label: Optional[str], hits: frozenset) -> bool:
+        keywords = _NER_RELEVANCE_KEYWORDS.get(label, ())
+        return any(keyword in hits for keyword in keywords)
 
     def map_entity_to_field(
-        self, entity, email_content
+        self, label: Optional[str], hits: frozenset
     ) -> (Optional[str], Optional[str]):
-        label = entity.get("entity_group")
-        text = entity.get("word")
-        if label == "PER":
-            if re.search(r"insured", email_content, re.IGNORECASE):
-                return "Insured Information", "Name"
-            elif re.search(r"adjuster", email_content, re.IGNORECASE):
-                return "Adjuster Information", "Adjuster Name"
-            elif re.search(r"handler", email_content, re.IGNORECASE):
-                return "Requesting Party", "Handler"
-            elif re.search(r"public adjuster", email_content, re.IGNORECASE):
-                return "Insured Information", "Public Adjuster"
-        elif label == "ORG":
-            if re.search(r"insurance company", email_content, re.IGNORECASE):
-                return "Requesting Party", "Insurance Company"
-            elif re.search(r"claims adjuster", email_content, re.IGNORECASE):
-                return "Adjuster Information", "Job Title"
-        elif label in ["LOC", "GPE"]:
-            if re.search(r"loss location", email_content, re.IGNORECASE):
-                return "Insured Information", "Loss Address"
-            elif re.search(r"address", email_content, re.IGNORECASE):
-                return "Adjuster Information", "Address"
-        elif label in ["DATE", "EVENT"]:
-            if re.search(r"loss", email_content, re.IGNORECASE):
-                return "Assignment Information", "Date of Loss/Occurrence"
-            elif re.search(r"incident", email_content, re.IGNORECASE):
-                return "Assignment Information", "Date of Loss/Occurrence"
-            elif re.search(r"damage", email_content, re.IGNORECASE):
-                return "Assignment Information", "Cause of loss"
-        elif label == "PHONE":
-            if re.search(r"contact number", email_content, re.IGNORECASE):
-                return "Insured Information", "Contact #"
-            elif re.search(r"adjuster phone", email_content, re.IGNORECASE):
-                return "Adjuster Information", "Adjuster Phone Number"
-        elif label == "EMAIL":
+        if label == "EMAIL":
             return "Adjuster Information", "Adjuster Email"
+        for keyword, target in _NER_FIELD_RULES.get(label, ()):
+            if keyword in hits:
+                return target
         return None, None
 
-    def donut_parsing(self, document_image: Union[str, Image.Image]) -> Dict[str, Any]:
+    def donut_parsing(
+        self,
+        document_images: Union[str, Image.Image, List[Union[str, Image.Image]]],
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Parses one document image, or a list of them in a single batched generate()
+        call. A single image returns its mapped dict; a list returns one dict per
+        image, with {} for images that could not be loaded or decoded.
+        """
+        if isinstance(document_images, list):
+            return self._donut_parse_batch(document_images)
+        return self._donut_parse_batch([document_images])[0]
+
+    def _donut_parse_batch(
+        self, document_images: List[Union[str, Image.Image]]
+    ) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = [{} for _ in document_images]
         try:
-            self.logger.debug("Starting Donut parsing.")
-            if isinstance(document_image, str):
-                document_image = Image.open(document_image).convert("RGB")
-                self.logger.debug("Loaded image from path.")
-            elif isinstance(document_image, Image.Image):
-                pass
-            else:
-                self.logger.warning(
-                    "Invalid document_image type: %s. Skipping Donut parsing.",
-                    type(document_image),
-                )
-                return {}
-            encoding = self.donut_processor(document_image, return_tensors="pt")
-            pixel_values = encoding.pixel_values.to(self.device)
+            self.logger.debug("Starting Donut parsing of %d image(s).", len(document_images))
+            images, slots = [], []
+            for index, document_image in enumerate(document_images):
+                if isinstance(document_image, str):
+                    document_image = Image.open(document_image).convert("RGB")
+                    self.logger.debug("Loaded image from path.")
+                elif not isinstance(document_image, Image.Image):
+                    self.logger.warning(
+                        "Invalid document_image type: %s. Skipping Donut parsing.",
+                        type(document_image),
+                    )
+                    continue
+                images.append(document_image)
+                slots.append(index)
+            if not images:
+                return results
+            encoding = self.donut_processor(images=images, return_tensors="pt")
             task_prompt = "<s_cord-v2>"
+            # Every document decodes from the same task prompt.
             decoder_input_ids = self.donut_processor.tokenizer(
                 task_prompt, add_special_tokens=False, return_tensors="pt"
-            ).input_ids.to(self.device)
+            ).input_ids.to(self.device).expand(len(images), -1)
             self.logger.debug("Generating output from Donut model.")
-            outputs = self.donut_model.generate(
-                pixel_values=pixel_values,
-                decoder_input_ids=decoder_input_ids,
-                max_length=self.donut_model.config.max_position_embeddings,
-                pad_token_id=self.donut_processor.tokenizer.pad_token_id,
-                eos_token_id=self.donut_processor.tokenizer.eos_token_id,
-                use_cache=True,
-            )
+            with torch.inference_mode(), torch.autocast(
+                device_type="cuda",
+                dtype=self.donut_model.dtype,
+                enabled=self.device == "cuda",
+            ):
+                encoder_outputs = self._encode_donut_pixels(encoding.pixel_values)
+                outputs = self.donut_model.generate(
+                    encoder_outputs=encoder_outputs,
+                    decoder_input_ids=decoder_input_ids,
+                    max_new_tokens=self.donut_max_new_tokens,
+                    pad_token_id=self.donut_processor.tokenizer.pad_token_id,
+                    eos_token_id=self.donut_processor.tokenizer.eos_token_id,
+                    num_beams=1,
+                    do_sample=False,
+                    use_cache=True,
+                )
             self.logger.debug("Decoding Donut model output.")
-            sequence = self.donut_processor.batch_decode(
+            sequences = self.donut_processor.batch_decode(
                 outputs, skip_special_tokens=True
-            )[0]
-            sequence = sequence.replace(
-                self.donut_processor.tokenizer.eos_token, ""
-            ).replace(self.donut_processor.tokenizer.pad_token, "")
-            json_data = self.donut_processor.token2json(sequence)
-            mapped_data = self.map_donut_output_to_schema(json_data)
-            self.logger.debug("Donut Parsing Result: %s", mapped_data)
-            return mapped_data
+            )
+            eos_token = self.donut_processor.tokenizer.eos_token
+            pad_token = self.donut_processor.tokenizer.pad_token
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            for index, sequence in zip(slots, sequences):
+                sequence = sequence.replace(eos_token, "").replace(pad_token, "")
+                try:
+                    json_data = self.donut_processor.token2json(sequence)
+                    results[index] = self.map_donut_output_to_schema(json_data)
+                except Exception as e:
+                    self.logger.error(
+                        "Error mapping Donut output for image %d: %s", index, e, exc_info=True
+                    )
+                if debug:
+                    self.logger.debug("Donut Parsing Result: %s", results[index])
         except Exception as e:
             self.logger.error("Error during Donut parsing: %s", e, exc_info=True)
-            return {}
+        return results
+
+    def _encode_donut_pixels(self, pixel_values: torch.Tensor) -> BaseModelOutput:
+        """
+        Runs the Swin encoder only for images not seen recently. Each image is keyed
+        by a digest of its CPU pixel tensor; hits reuse the stored hidden states.
+        """
+        cache = self._donut_encoder_cache
+        keys = [
+            hashlib.blake2b(image.numpy().tobytes(), digest_size=16).digest()
+            for image in pixel_values
+        ]
+        hidden_states = [cache.get(key) for key in keys]
+        missing = [i for i, hidden in enumerate(hidden_states) if hidden is None]
+        if missing:
+            pending = pixel_values[missing]
+            if self.device == "cuda":
+                # Pinned host memory lets the copy run asynchronously.
+                pending = pending.pin_memory()
+            encoded = self.donut_model.encoder(
+                pixel_values=pending.to(
+                    self.device, dtype=self.donut_model.dtype, non_blocking=True
+                )
+            ).last_hidden_state
+            for i, hidden in zip(missing, encoded):
+                # CUDA graph replays reuse their output buffer; keep a private copy.
+                hidden_states[i] = hidden.clone()
+        for key, hidden in zip(keys, hidden_states):
+            cache[key] = hidden
+            cache.move_to_end(key)
+        while len(cache) > DONUT_ENCODER_CACHE_SIZE:
+            cache.popitem(last=False)
+        self.logger.debug(
+            "Donut encoder cache: %d hit(s), %d miss(es).",
+            len(keys) - len(missing),
+            len(missing),
+        )
+        return BaseModelOutput(last_hidden_state=torch.stack(hidden_states))
 
     def map_donut_output_to_schema(self, donut_json: Dict[str, Any]) -> Dict[str, Any]:
-        mapped_data: Dict[str, Any] = {}
+        mapped_data = collections.defaultdict(lambda: collections.defaultdict(list))
         try:
-            field_mapping = {
-                "policy_number": ("Adjuster Information", "Policy #"),
-                "claim_number": ("Requesting Party", "Carrier Claim Number"),
-                "insured_name": ("Insured Information", "Name"),
-                "loss_address": ("Insured Information", "Loss Address"),
-                "adjuster_name": ("Adjuster Information", "Adjuster Name"),
-                "adjuster_phone": ("Adjuster Information", "Adjuster Phone Number"),
-                "adjuster_email": ("Adjuster Information", "Adjuster Email"),
-                "date_of_loss": ("Assignment Information", "Date of Loss/Occurrence"),
-                "cause_of_loss": ("Assignment Information", "Cause of loss"),
-                "loss_description": ("Assignment Information", "Loss Description"),
-                "inspection_type": ("Assignment Information", "Inspection type"),
-                "repair_progress": (
-                    "Assignment Information",
-                    "Repair or Mitigation Progress",
-                ),
-                "residence_occupied": (
-                    "Assignment Information",
-                    "Residence Occupied During Loss",
-                ),
-                "someone_home": (
-                    "Assignment Information",
-                    "Was Someone home at time of damage",
-                ),
-                "type": ("Assignment Information", "Type"),
-                "additional_instructions": (
-                    "Additional details/Special Instructions",
-                    "Details",
-                ),
-                "attachments": ("Attachment(s)", "Files"),
-                "owner_tenant": (
-                    "Insured Information",
-                    "Is the insured an Owner or a Tenant of the loss location?",
-                ),
-            }
+            # Bound once; None when debug output is filtered out anyway.
+            debug = (
+                self.logger.debug if self.logger.isEnabledFor(logging.DEBUG) else None
+            )
             for item in donut_json.get("form", []):
                 field_name = item.get("name")
-                field_value = item.get("value")
-                if field_name in field_mapping:
-                    section, qb_field = field_mapping[field_name]
-                    if field_name in ["residence_occupied", "someone_home"]:
+                target = _DONUT_FIELD_MAPPING.get(field_name)
+                if target is not None:
+                    section, qb_field = target
+                    field_value = item.get("value")
+                    if field_name in _DONUT_BOOL_FIELDS:
                         field_value = field_value.lower() == "yes"
-                    mapped_data.setdefault(section, {}).setdefault(qb_field, []).append(
-                        field_value
-                    )
-                    self.logger.debug(
-                        "Mapped Donut field '%s' to '%s - %s' with value '%s'",
-                        field_name,
-                        section,
-                        qb_field,
-                        field_value,
-                    )
-            return mapped_data
+                    mapped_data[section][qb_field].append(field_value)
+                    if debug:
+                        debug(
+                            "Mapped Donut field '%s' to '%s - %s' with value '%s'",
+                            field_name,
+                            section,
+                            qb_field,
+                            field_value,
+                        )
+            return {section: dict(fields) for section, fields in mapped_data.items()}
         except Exception as e:
             self.logger.error(
                 "Error during mapping Donut output to schema: %s", e, exc_info=True
             )
             return {}
 
+    @staticmethod
+    def _find_values_in_text(values: Set[str], text: str) -> Set[str]:
+        """Returns the subset of ``values`` that occur as substrings of ``text``."""
+        if ahocorasick is None or len(values) < 2:
+            return {value for value in values if value in text}
+        automaton = ahocorasick.Automaton()
+        for value in values:
+            automaton.add_word(value, value)
+        automaton.make_automaton()
+        return {value for _, value in automaton.iter(text)}
+
     def _stage_validation_internal(
         self, email_content: str, parsed_data: Dict[str, Any]
     ):
         self.logger.debug("Starting validation parsing.")
         inconsistencies = []
         try:
+            triples = []
             for section, fields in parsed_data.items():
                 for field, value in fields.items():
                     if isinstance(value, list) and value:
                         value = value[0]
-                    if isinstance(value, str) and value != "N/A":
-                        if value.lower() not in email_content.lower():
-                            inconsistencies.append(
-                                f"Inconsistency in {section} - {field}: '{value}' not found in email content"
-                            )
+                    # An empty string is trivially "in" the email, as before.
+                    if isinstance(value, str) and value and value != "N/A":
+                        triples.append((section, field, value))
+            found = self._find_values_in_text(
+                {value.lower() for _, _, value in triples}, email_content.lower()
+            )
+            inconsistencies.extend(
+                f"Inconsistency in {section} - {field}: '{value}' not found in email content"
+                for section, field, value in triples
+                if value.lower() not in found
+            )
             required_fields = [
                 ("Requesting Party", "Insurance Company"),
                 ("Requesting Party", "Handler"),
@@ -758,14 +1267,12 @@ class EnhancedParser(BaseParser):
                 ("Assignment Information", "Inspection type"),
             ]
             for section, field in required_fields:
-                if not parsed_data.get(section, {}).get(field):
+                if not parsed_data.get(section, _EMPTY).get(field):
                     inconsistencies.append(
                         f"Missing required field: {section} - {field}"
                     )
             if inconsistencies:
-                parsed_data["validation_issues"] = (
-                    parsed_data.get("validation_issues", []) + inconsistencies
-                )
+                parsed_data.setdefault("validation_issues", []).extend(inconsistencies)
                 self.logger.warning("Validation issues found: %s", inconsistencies)
             else:
                 self.logger.info("Validation parsing completed successfully.")
@@ -783,17 +1290,11 @@ class EnhancedParser(BaseParser):
         validation_errors: List[str] = []
         try:
             for section, fields in QUICKBASE_SCHEMA.items():
-                if section in [
-                    "Entities",
-                    "TransformerEntities",
-                    "missing_fields",
-                    "inconsistent_fields",
-                    "user_notifications",
-                    "validation_issues",
-                ]:
+                if section in _SCHEMA_VALIDATION_SKIP_SECTIONS:
                     continue
+                section_data = parsed_data.get(section, _EMPTY)
                 for field, rules in fields.items():
-                    value = parsed_data.get(section, {}).get(field)
+                    value = section_data.get(field)
                     is_valid, error_msg = self._validate_against_schema(
                         section, field, value
                     )
@@ -805,16 +1306,14 @@ class EnhancedParser(BaseParser):
                             field, []
                         )
                         if known_values:
-                            best_match = max(
-                                known_values,
-                                key=lambda x: fuzz.partial_ratio(
-                                    x.lower(), value[0].lower()
-                                ),
-                                default=None,
+                            match = process.extractOne(
+                                value[0].lower(),
+                                self._known_values_lower[field],
+                                scorer=fuzz.partial_ratio,
+                                score_cutoff=self.config.get("fuzzy_threshold", 90),
                             )
-                            if best_match and fuzz.partial_ratio(
-                                best_match.lower(), value[0].lower()
-                            ) >= self.config.get("fuzzy_threshold", 90):
+                            if match:
+                                best_match = known_values[match[2]]
                                 parsed_data[section][field] = [best_match]
                                 self.logger.debug(
                                     "Updated %s in %s with best match: %s",
@@ -847,184 +1346,92 @@ class EnhancedParser(BaseParser):
                     "Inconsistent fields identified: %s", inconsistent_fields
                 )
             if validation_errors:
-                parsed_data["validation_issues"] = (
-                    parsed_data.get("validation_issues", []) + validation_errors
-                )
+                parsed_data.setdefault("validation_issues", []).extend(validation_errors)
                 self.logger.warning("Validation errors found: %s", validation_errors)
         except Exception as e:
             self.logger.error("Error during schema validation: %s", e, exc_info=True)
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
 
     def validate_with_bart(
         self, parsed_data: Dict[str, Any], original_email: str
     ) -> Dict[str, Any]:
+        self._lazy_load_validation_model()
         if not self.validation_pipeline:
             self.logger.error("Validation pipeline is not initialized.")
             return parsed_data
 
         self.logger.info("Starting BART validation.")
 
-        validation_prompts = {
-            "Requesting Party": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Requesting Party
-Parsed Data: {json.dumps(parsed_data.get('Requesting Party', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
-
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Insurance Company": "Ensure the company name is spelled correctly.",
-        "Handler": "Provide contact information if missing.",
-        "Carrier Claim Number": "Verify the format of the claim number."
-    }}
-}}
-<END JSON>
-""",
-            "Insured Information": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Insured Information
-Parsed Data: {json.dumps(parsed_data.get('Insured Information', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
-
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Name": "Ensure the insured's name is complete and correctly spelled.",
-        "Contact #": "Verify the contact number format.",
-        "Loss Address": "Confirm the completeness of the loss address.",
-        "Public Adjuster": "Provide contact details if missing.",
-        "Is the insured an Owner or a Tenant of the loss location?": "Confirm the ownership status."
-    }}
-}}
-<END JSON>
-""",
-            "Adjuster Information": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Adjuster Information
-Parsed Data: {json.dumps(parsed_data.get('Adjuster Information', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
-
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Adjuster Name": "Ensure the adjuster's name is correctly spelled.",
-        "Adjuster Phone Number": "Verify the phone number format.",
-        "Adjuster Email": "Confirm the email format is valid.",
-        "Job Title": "Provide the adjuster's job title if missing.",
-        "Address": "Ensure the address is complete and correctly formatted.",
-        "Policy #": "Check if the policy number follows the required pattern."
-    }}
-}}
-<END JSON>
-""",
-            "Assignment Information": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Assignment Information
-Parsed Data: {json.dumps(parsed_data.get('Assignment Information', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
-
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Date of Loss/Occurrence": "Ensure the date follows the YYYY-MM-DD format.",
-        "Cause of loss": "Specify the exact cause of the loss.",
-        "Facts of Loss": "Provide detailed facts related to the loss.",
-        "Loss Description": "Ensure the description is comprehensive.",
-        "Residence Occupied During Loss": "Confirm whether the residence was occupied.",
-        "Was Someone home at time of damage": "Specify if someone was present during the damage.",
-        "Repair or Mitigation Progress": "Update the current status of repairs or mitigation.",
-        "Type": "Clarify the type of loss or damage.",
-        "Inspection type": "Specify the type of inspection conducted."
-    }}
-}}
-<END JSON>
-""",
-            "Assignment Type": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Assignment Type
-Parsed Data: {json.dumps(parsed_data.get('Assignment Type', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
-
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Wind": "Confirm if wind-related damage is applicable.",
-        "Structural": "Verify if structural damage is present.",
-        "Hail": "Check for any hail-related issues.",
-        "Foundation": "Ensure foundation damage is assessed.",
-        "Other": "Provide details for any other types of damage."
-    }}
-}}
-<END JSON>
-""",
-            "Additional details/Special Instructions": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Additional details/Special Instructions
-Parsed Data: {json.dumps(parsed_data.get('Additional details/Special Instructions', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
-
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Additional details/Special Instructions": "Ensure all special instructions are clearly stated."
-    }}
-}}
-<END JSON>
-""",
-            "Attachment(s)": f"""\
-Please validate the following section and provide suggestions for missing or incorrect fields in JSON format.
-
-Section: Attachment(s)
-Parsed Data: {json.dumps(parsed_data.get('Attachment(s)', {}), indent=2)}
-Email Content: {original_email}
-
-Provide your suggestions within the following JSON structure, enclosed between <BEGIN JSON> and <END JSON>:
+        tokenizer = self.validation_pipeline.tokenizer
+        email_ids = tokenizer(
+            original_email,
+            truncation=True,
+            max_length=VALIDATION_MAX_EMAIL_TOKENS,
+            add_special_tokens=False,
+        )["input_ids"]
+        email_block = tokenizer.decode(email_ids, skip_special_tokens=True)
+        validation_prompts = {}
+        for section, field_suggestions in FIELD_SUGGESTIONS.items():
+            section_data = parsed_data.get(section, {})
+            missing = [
+                field
+                for field in field_suggestions
+                if self._is_empty_value(
+                    section_data.get(field)
+                    if isinstance(section_data, dict)
+                    else section_data
+                )
+            ]
+            if not missing:
+                continue
+            validation_prompts[section] = _VALIDATION_PROMPT_TEMPLATE.format_map(
+                {
+                    "section": section,
+                    "parsed": _dumps_compact(section_data),
+                    "email": email_block,
+                    "suggestions": ",\n".join(
+                        f"        {json.dumps(field)}: {json.dumps(field_suggestions[field])}"
+                        for field in missing
+                    )
+                    + "\n",
+                }
+            )
 
-<BEGIN JSON>
-{{
-    "suggestions": {{
-        "Attachment(s)": "Verify that all mentioned attachments are included and accessible."
-    }}
-}}
-<END JSON>
-""",
-        }
+        if not validation_prompts:
+            self.logger.info("All sections complete; skipping BART validation.")
+            return parsed_data
 
         validation_results = {}
-        for section, prompt in validation_prompts.items():
+        try:
+            self.logger.debug(
+                f"Generating BART responses for {len(validation_prompts)} sections"
+            )
+            outputs = self.validation_pipeline(
+                list(validation_prompts.values()),
+                max_length=300,
+                num_return_sequences=1,
+                num_beams=1,
+                do_sample=False,
+                batch_size=len(validation_prompts),
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Batched BART validation failed ({e}); falling back to per-section calls."
+            )
+            outputs = self._validate_sections_concurrently(validation_prompts)
+
+        for section, output in zip(validation_prompts, outputs):
             try:
-                self.logger.debug(f"Generating BART response for section: {section}")
-                self.logger.debug(f"Prompt for section '{section}':\n{prompt}")
-                output = self.validation_pipeline(
-                    prompt, max_length=300, num_return_sequences=1
-                )
-                generated_text = output[0]["generated_text"].strip()
+                if output is None:
+                    raise RuntimeError("No BART output for section")
+                # text2text pipelines unwrap single-sequence results for list inputs.
+                if isinstance(output, list):
+                    output = output[0]
+                generated_text = output["generated_text"].strip()
                 self.logger.debug(f"Raw BART response for {section}:\n{generated_text}")
 
-                json_str = self.extract_json(generated_text)
-                if json_str:
-                    suggestions = json.loads(json_str)
+                suggestions = self.extract_json(generated_text)
+                if suggestions is not None:
                     validation_results[section] = suggestions.get("suggestions", {})
                     self.logger.debug(
                         f"Extracted JSON for {section}: {suggestions.get('suggestions', {})}"
@@ -1043,13 +1450,13 @@ Provide your suggestions within the following JSON structure, enclosed between <
 
         for section, result in validation_results.items():
             if "validation_issue" in result:
-                parsed_data.setdefault("validation_issues", []).append(
-                    f"{section}: {result['validation_issue']}"
+                self._record_issue(
+                    parsed_data, f"{section}: {result['validation_issue']}"
                 )
             else:
                 for field, suggestion in result.items():
-                    parsed_data.setdefault("validation_issues", []).append(
-                        f"{section} -> {field}: {suggestion}"
+                    self._record_issue(
+                        parsed_data, f"{section} -> {field}: {suggestion}"
                     )
                     self.logger.info(
                         f"BART suggests reviewing '{field}' in section '{section}': {suggestion}"
@@ -1058,17 +1465,43 @@ Provide your suggestions within the following JSON structure, enclosed between <
         self.logger.info("BART validation completed.")
         return parsed_data
 
-    def extract_json(self, text: str) -> Optional[str]:
+    def _validate_sections_concurrently(
+        self, validation_prompts: Dict[str, str]
+    ) -> List[Optional[Any]]:
+        # Two workers let one prompt tokenize while the other runs on the model.
+        outputs: List[Optional[Any]] = [None] * len(validation_prompts)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(
+                    self.validation_pipeline,
+                    prompt,
+                    max_length=300,
+                    num_return_sequences=1,
+                    num_beams=1,
+                    do_sample=False,
+                ): idx
+                for idx, prompt in enumerate(validation_prompts.values())
+            }
+            for future in as_completed(futures):
+                try:
+                    outputs[futures[future]] = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        f"Error during BART validation call: {e}", exc_info=True
+                    )
+        return outputs
+
+    @staticmethod
+    def _is_empty_value(value: Any) -> bool:
+        return not value or value == "N/A" or value == ["N/A"]
+
+    def extract_json(self, text: str) -> Optional[Dict[str, Any]]:
         try:
-            start_delimiter = "<BEGIN JSON>"
-            end_delimiter = "<END JSON>"
-            json_start = text.find(start_delimiter)
-            json_end = text.find(end_delimiter)
-            if json_start == -1 or json_end == -1:
+            match = _JSON_BLOCK_RE.search(text)
+            if not match:
                 return None
-            json_content = text[json_start + len(start_delimiter) : json_end].strip()
-            json.loads(json_content)
-            return json_content
+            parsed = _loads(match.group(1).strip())
+            return parsed if isinstance(parsed, dict) else None
         except json.JSONDecodeError:
             self.logger.warning("Failed to decode JSON from BART response.")
             return None
@@ -1294,105 +1727,22 @@ Provide your suggestions within the following JSON structure, enclosed between <
             self.logger.error(f"Error during data validation: {str(e)}", exc_info=True)
             raise ValueError(f"Data validation failed: {str(e)}")
 
-    def _validate_merged_data(self, data: Dict[str, Any]) -> None:
-        required_sections = {
-            "Requesting Party": {
-                "Insurance Company": list,
-                "Handler": list,
-                "Carrier Claim Number": list,
-            },
-            "Insured Information": {
-                "Name": list,
-                "Contact #": list,
-                "Loss Address": list,
-                "Public Adjuster": list,
-                "Is the insured an Owner or a Tenant of the loss location?": list,
-            },
-            "Adjuster Information": {
-                "Adjuster Name": list,
-                "Adjuster Phone Number": list,
-                "Adjuster Email": list,
-                "Job Title": list,
-                "Address": list,
-                "Policy #": list,
-            },
-            "Assignment Information": {
-                "Date of Loss/Occurrence": list,
-                "Cause of loss": list,
-                "Facts of Loss": list,
-                "Loss Description": list,
-                "Residence Occupied During Loss": list,
-                "Was Someone home at time of damage": list,
-                "Repair or Mitigation Progress": list,
-                "Type": list,
-                "Inspection type": list,
-            },
-            "Assignment Type": {
-                "Wind": list,
-                "Structural": list,
-                "Hail": list,
-                "Foundation": list,
-                "Other": list,
-            },
-        }
-        try:
-            for section, fields in required_sections.items():
-                if section not in data:
-                    self.logger.warning(f"Missing required section: {section}")
-                    data[section] = {}
-                for field, field_type in fields.items():
-                    if field not in data[section]:
-                        if field_type == list:
-                            data[section][field] = ["N/A"]
-                        else:
-                            data[section][field] = "N/A"
-                    if field_type == list and not isinstance(
-                        data[section][field], list
-                    ):
-                        data[section][field] = [data[section][field]]
-            if "Assignment Type" in data and "Other" in data["Assignment Type"]:
-                other_data = data["Assignment Type"]["Other"]
-                if isinstance(other_data, list) and other_data:
-                    if isinstance(other_data[0], dict):
-                        if not all(
-                            key in other_data[0] for key in ["Checked", "Details"]
-                        ):
-                            self.logger.warning(
-                                "Invalid Other field format in Assignment Type"
-                            )
-                            data["Assignment Type"]["Other"] = [
-                                {"Checked": False, "Details": "N/A"}
-                            ]
-                    else:
-                        data["Assignment Type"]["Other"] = [
-                            {"Checked": False, "Details": "N/A"}
-                        ]
-            for section in [
-                "Entities",
-                "TransformerEntities",
-                "Additional details/Special Instructions",
-                "Attachment(s)",
-            ]:
-                if section not in data:
-                    data[section] = {} if section != "Attachment(s)" else []
-            self.logger.debug("Data validation completed successfully")
-        except Exception as e:
-            self.logger.error(f"Error during data validation: {str(e)}", exc_info=True)
-            raise ValueError(f"Data validation failed: {str(e)}")
-
     def validate_input(
         self,
         email_content: Optional[str] = None,
         document_image: Optional[Union[str, Image.Image]] = None,
     ) -> bool:
-        if not email_content and not document_image:
-            self.logger.error("No input provided")
+        if email_content is not None and not isinstance(email_content, str):
+            self.logger.error("Invalid email_content type: %s", type(email_content))
             return False
-        if document_image and not isinstance(document_image, (str, Image.Image)):
+        if document_image is not None and not isinstance(
+            document_image, (str, Image.Image)
+        ):
             self.logger.error("Invalid document_image type: %s", type(document_image))
             return False
-        if email_content and not isinstance(email_content, str):
-            self.logger.error("Invalid email_content type: %s", type(email_content))
+        # Both are now None, str or Image, so truthiness is a cheap emptiness check.
+        if not email_content and not document_image:
+            self.logger.error("No input provided")
             return False
         return True
 
@@ -1408,59 +1758,60 @@ Provide your suggestions within the following JSON structure, enclosed between <
         self, parsed_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         self.logger.debug("Starting post-processing of parsed data.")
-        skip_sections = [
-            "TransformerEntities",
-            "Entities",
-            "missing_fields",
-            "inconsistent_fields",
-            "user_notifications",
-            "validation_issues",
-        ]
         try:
             for section, fields in parsed_data.items():
-                if section in skip_sections or not isinstance(fields, dict):
+                if section in _POST_PROCESSING_SKIP_SECTIONS or not isinstance(
+                    fields, dict
+                ):
                     continue
                 for field, value_list in fields.items():
                     if not isinstance(value_list, list):
                         continue
+                    is_date = "Date" in field or "Loss/Occurrence" in field
+                    is_phone = any(term in field for term in _PHONE_TERMS)
+                    is_bool = field in _BOOL_FIELDS
+                    is_address = "Address" in field
+                    is_email = "Email" in field
                     for idx, value in enumerate(value_list):
-                        if "Date" in field or "Loss/Occurrence" in field:
-                            formatted_date = self.format_date(value)
+                        hashable = isinstance(value, str)
+                        if is_date:
+                            formatted_date = (
+                                self._format_date_cached(value)
+                                if hashable
+                                else self.format_date(value)
+                            )
                             parsed_data[section][field][idx] = formatted_date
                             self.logger.debug(
                                 "Formatted date for %s: %s", field, formatted_date
                             )
-                        if any(
-                            phone_term in field
-                            for phone_term in ["Contact #", "Phone Number", "Phone"]
-                        ):
-                            formatted_phone = self.format_phone_number(value)
+                        if is_phone:
+                            formatted_phone = (
+                                self._format_phone_number_cached(value)
+                                if hashable
+                                else self.format_phone_number(value)
+                            )
                             parsed_data[section][field][idx] = formatted_phone
                             self.logger.debug(
                                 "Formatted phone number for %s: %s",
                                 field,
                                 formatted_phone,
                             )
-                        if field in [
-                            "Wind",
-                            "Structural",
-                            "Hail",
-                            "Foundation",
-                            "Residence Occupied During Loss",
-                            "Was Someone home at time of damage",
-                        ]:
+                        if is_bool:
                             if isinstance(value, str):
-                                parsed_data[section][field][idx] = value.lower() in [
-                                    "yes",
-                                    "true",
-                                ]
-                        if "Address" in field:
-                            formatted_address = self._format_address(value)
+                                parsed_data[section][field][idx] = (
+                                    value.lower() in _POST_PROCESSING_TRUE_VALUES
+                                )
+                        if is_address:
+                            formatted_address = (
+                                self._format_address_cached(value)
+                                if hashable
+                                else self._format_address(value)
+                            )
                             parsed_data[section][field][idx] = formatted_address
                             self.logger.debug(
                                 "Formatted address for %s: %s", field, formatted_address
                             )
-                        if "Email" in field:
+                        if is_email:
                             formatted_email = value.lower().strip()
                             parsed_data[section][field][idx] = formatted_email
                             self.logger.debug(
@@ -1490,25 +1841,21 @@ Provide your suggestions within the following JSON structure, enclosed between <
                 self.logger.info("JSON validation passed.")
             else:
                 self.logger.error("JSON validation failed: %s", error_message)
-                parsed_data["validation_issues"] = parsed_data.get(
-                    "validation_issues", []
-                ) + [error_message]
+                self._record_issue(parsed_data, error_message)
         except Exception as e:
             self.logger.error("Error during JSON validation: %s", e, exc_info=True)
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
 
     def format_date(self, date_string: str) -> str:
         if date_string == "N/A":
             return date_string
         self.logger.debug("Formatting date string: %s", date_string)
         try:
-            parsed_date = dateutil.parser.parse(date_string)
+            parsed_date = parse_date(date_string)
             formatted_date = parsed_date.strftime("%Y-%m-%d")
             self.logger.debug("Formatted date: %s", formatted_date)
             return formatted_date
-        except (ValueError, TypeError) as e:
+        except (ValueError, TypeError, OverflowError) as e:
             self.logger.warning("Failed to parse date '%s': %s", date_string, e)
             return "N/A"
 
@@ -1533,21 +1880,16 @@ Provide your suggestions within the following JSON structure, enclosed between <
     def _clean_text(self, text: str) -> str:
         if not isinstance(text, str):
             return text
-        text = " ".join(text.split())
-        text = re.sub(r"_{2,}", "", text)
-        text = re.sub(r"\[cid:[^\]]+\]", "", text)
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-        text = re.sub(r"([.!?])\1+", r"\1", text)
-        text = re.sub(r'["“”]', '"', text)  # Simplified quote normalization
-        return text.strip()
+        text = _WHITESPACE_RE.sub(" ", text)
+        text = _CLEAN_TEXT_RE.sub(lambda m: m.group(1) or "", text)
+        return text.translate(_QUOTE_TABLE).strip()  # Simplified quote normalization
 
     def _format_address(self, address: str) -> str:
         if not isinstance(address, str):
             return address
-        address = re.sub(r"\s+", " ", address.strip())
-        address = re.sub(r"\s*,\s*", ", ", address)
-        state_pattern = r"\b([A-Za-z]{2})\b\s*(\d{5}(?:-\d{4})?)?$"
-        match = re.search(state_pattern, address)
+        address = _WHITESPACE_RE.sub(" ", address.strip())
+        address = _ADDRESS_COMMA_RE.sub(", ", address)
+        match = _ADDRESS_STATE_RE.search(address)
         if match:
             state = match.group(1)
             if len(state) == 2:
@@ -1559,17 +1901,16 @@ Provide your suggestions within the following JSON structure, enclosed between <
     def verify_attachments(self, attachments: List[str], email_content: str) -> bool:
         self.logger.debug("Verifying attachments: %s", attachments)
         try:
-            mentioned_attachments = re.findall(
-                r"attached\s+([\w\s.,]+)", email_content, re.IGNORECASE
-            )
+            mentioned_attachments = _ATTACHED_RE.findall(email_content)
             mentioned_attachments = [
                 att.strip()
                 for sublist in mentioned_attachments
                 for att in sublist.split(",")
             ]
+            # NUL cannot occur in a mention, so no match can span two attachments.
+            haystack = "\0".join(attachments).lower()
             all_mentioned_present = all(
-                any(mention.lower() in att.lower() for att in attachments)
-                for mention in mentioned_attachments
+                mention.lower() in haystack for mention in mentioned_attachments
             )
             count_matches = len(attachments) == len(mentioned_attachments)
             if all_mentioned_present and count_matches:
@@ -1583,26 +1924,40 @@ Provide your suggestions within the following JSON structure, enclosed between <
             )
             return False
 
-    def cleanup_resources(self):
+    def cleanup_resources(self, release_cuda_cache: bool = False):
         self.logger.info("Cleaning up resources.")
         try:
-            # Create a list of models to cleanup
-            models_to_cleanup = [
-                (self.donut_model, "Donut model"),
-                (self.ner_pipeline, "NER pipeline"),
-                (self.validation_pipeline, "Validation pipeline"),
-                (self.summarization_pipeline, "Summarization pipeline"),
-            ]
-
-            for model, name in models_to_cleanup:
-                if hasattr(self, model.__name__) and model is not None:
-                    if hasattr(model, "model"):
-                        model.model.cpu()
-                    elif hasattr(model, "to"):
-                        model.cpu()
-                    self.logger.debug(f"{name} moved to CPU.")
-
-            torch.cuda.empty_cache()
+            # Without CUDA every model already lives on the CPU.
+            if torch.cuda.is_available():
+                for attr, name in self._CLEANUP_MODELS:
+                    model = getattr(self, attr, None)
+                    if model is not None:
+                        if hasattr(model, "model"):
+                            model = model.model
+                        if not hasattr(model, "to"):
+                            continue
+                        param = next(model.parameters(), None)
+                        if param is not None and param.device.type != "cpu":
+                            model.cpu()
+                            self.logger.debug(f"{name} moved to CPU.")
+
+            with self._stage_executor_lock:
+                if self._stage_executor is not None:
+                    self._stage_executor.shutdown(wait=False)
+                    self._stage_executor = None
+            close_pipeline(self.ner_pipeline)
+            close_pipeline(self.summarization_pipeline)
+            # Emptying the caching allocator is an expensive sweep that only helps
+            # when something else needs the GPU memory, so callers opt in.
+            if release_cuda_cache and torch.cuda.is_available():
+                # empty_cache can only return blocks no tensor still references.
+                for attr, _ in self._CLEANUP_MODELS:
+                    setattr(self, attr, None)
+                self.donut_processor = None
+                self._donut_encoder_cache = collections.OrderedDict()
+                gc.collect()
+                torch.cuda.synchronize()
+                torch.cuda.empty_cache()
             self.logger.info("Resources cleaned up successfully.")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}", exc_info=True)
@@ -1620,29 +1975,20 @@ Provide your suggestions within the following JSON structure, enclosed between <
         """
         self.logger.warning("Attempting to recover from %s failure", stage)
     
-        # Map stages to their initialization methods
-        recoverable_stages = {
-            "ner_parsing": self.init_ner,
-            "donut_parsing": self.init_donut,
-            "validation_parsing": self.init_validation_model,
-            "schema_validation": self.init_validation_model,
-            "summarization": self.init_summarization_model,
-            # Post processing and JSON validation don't need model recovery
-            "post_processing": None,
-            "json_validation": None,
-        }
-    
         # Convert stage name to standardized key
-        stage_key = stage.lower().replace(" ", "_")
+        stage_key = _stage_key(stage)
     
         # Check if stage is recoverable and has an initialization method
-        if stage_key in recoverable_stages and recoverable_stages[stage_key]:
+        init_method = self._RECOVERY_METHODS.get(stage_key)
+        if init_method:
             try:
                 # Attempt to reinitialize the corresponding model
-                recoverable_stages[stage_key]()
+                getattr(self, init_method)()
     
                 # Verify recovery was successful
-                recovery_successful = self.health_check()
+                recovery_successful = self.health_check(
+                    [self._RECOVERY_COMPONENTS[stage_key]]
+                )
                 if recovery_successful:
                     self.logger.info(f"Successfully recovered from {stage} failure")
                 else:
@@ -1660,11 +2006,22 @@ Provide your suggestions within the following JSON structure, enclosed between <
     def _reinitialize_models(self) -> bool:
         try:
             self.logger.info("Reinitializing relevant models.")
-            # Reinitialize only the failed stage's model
-            self.init_ner()
-            self.init_donut()
-            self.init_validation_model()
-            health = self.health_check()
+            init_methods = (self.init_ner, self.init_donut, self.init_validation_model)
+            # from_pretrained is dominated by disk/hub I/O, so the loads overlap well.
+            try:
+                with ThreadPoolExecutor(max_workers=len(init_methods)) as executor:
+                    futures = [executor.submit(init) for init in init_methods]
+                    for future in futures:
+                        future.result()
+            except Exception as e:
+                self.logger.warning(
+                    "Parallel reinitialization failed (%s); retrying serially.", e
+                )
+                for init in init_methods:
+                    init()
+            health = self.health_check(
+                ["ner_pipeline", "donut_model", "validation_pipeline"]
+            )
             if health:
                 self.logger.info("Reinitialization successful.")
                 return True
@@ -1677,17 +2034,31 @@ Provide your suggestions within the following JSON structure, enclosed between <
             )
             return False
 
+    # Stages run on several threads; the lock keeps two of them from loading the
+    # same model twice. The unlocked check keeps the loaded case lock-free.
     def _lazy_load_ner(self):
         if self.ner_pipeline is None:
-            self.init_ner()
+            with self._model_load_lock:
+                if self.ner_pipeline is None:
+                    self.init_ner()
 
     def _lazy_load_donut(self):
         if self.donut_model is None or self.donut_processor is None:
-            self.init_donut()
+            with self._model_load_lock:
+                if self.donut_model is None or self.donut_processor is None:
+                    self.init_donut()
 
     def _lazy_load_validation_model(self):
         if self.validation_pipeline is None:
-            self.init_validation_model()
+            with self._model_load_lock:
+                if self.validation_pipeline is None:
+                    self.init_validation_model()
+
+    def _lazy_load_summarization_model(self):
+        if self.summarization_pipeline is None:
+            with self._model_load_lock:
+                if self.summarization_pipeline is None:
+                    self.init_summarization_model()
 
     def __enter__(self):
         return self
@@ -1713,9 +2084,11 @@ Provide your suggestions within the following JSON structure, enclosed between <
     def _check_memory_usage(self) -> Dict[str, float]:
         memory_info = {}
         if torch.cuda.is_available():
+            # One allocator snapshot instead of three separate queries.
+            stats = torch.cuda.memory_stats()
             memory_info["cuda"] = {
-                "allocated": torch.cuda.memory_allocated() / 1024**2,
-                "cached": torch.cuda.memory_reserved() / 1024**2,
-                "max_allocated": torch.cuda.max_memory_allocated() / 1024**2,
+                "allocated": stats.get("allocated_bytes.all.current", 0) / 1024**2,
+                "cached": stats.get("reserved_bytes.all.current", 0) / 1024**2,
+                "max_allocated": stats.get("allocated_bytes.all.peak", 0) / 1024**2,
             }
         return memory_info
\ No newline at end of file
@@ -13,7 +13,7 @@ import spacy
 from spacy.cli import download as spacy_download
 from spacy.util import is_package
 from transformers import pipeline, AutoTokenizer, AutoModelForTokenClassification
-from thefuzz import fuzz  
+from rapidfuzz import fuzz  
 
 from src.parsers.base_parser import BaseParser
 from src.parsers.rule_based_parser import RuleBasedParser
@@ -1,11 +1,61 @@
 # src\parsers\stages\ner_parsing.py
 
 import logging
-from typing import Dict, Any, List
+import os
+from collections import defaultdict
+from typing import Dict, Any, FrozenSet, List, Optional
 from transformers import AutoTokenizer, AutoModelForTokenClassification
 from transformers import pipeline
 import torch
 
+# Entity label -> ordered (trigger, (section, field)) rules; the first trigger
+# found in the email decides the field.
+LABEL_FIELD_RULES = {
+    "PER": (
+        ("insured", ("Insured Information", "Name")),
+        ("adjuster", ("Adjuster Information", "Adjuster Name")),
+        ("handler", ("Requesting Party", "Handler")),
+        ("public adjuster", ("Insured Information", "Public Adjuster")),
+    ),
+    "ORG": (
+        ("insurance company", ("Requesting Party", "Insurance Company")),
+        ("claims adjuster", ("Adjuster Information", "Job Title")),
+    ),
+    "LOC": (
+        ("loss location", ("Insured Information", "Loss Address")),
+        ("address", ("Adjuster Information", "Address")),
+    ),
+    "DATE": (
+        ("loss", ("Assignment Information", "Date of Loss/Occurrence")),
+        ("incident", ("Assignment Information", "Date of Loss/Occurrence")),
+        ("damage", ("Assignment Information", "Cause of loss")),
+    ),
+    "PHONE": (
+        ("contact number", ("Insured Information", "Contact #")),
+        ("adjuster phone", ("Adjuster Information", "Adjuster Phone Number")),
+    ),
+}
+LABEL_FIELD_RULES["GPE"] = LABEL_FIELD_RULES["LOC"]
+LABEL_FIELD_RULES["EVENT"] = LABEL_FIELD_RULES["DATE"]
+
+# Context phrases map_entity_to_field looks for in the email.
+FIELD_TRIGGERS = frozenset(
+    trigger for rules in LABEL_FIELD_RULES.values() for trigger, _ in rules
+)
+
+def find_field_triggers(email_content: str) -> FrozenSet[str]:
+    """
+    Returns the FIELD_TRIGGERS present in the email (case-insensitive).
+
+    Args:
+        email_content (str): The content of the email.
+
+    Returns:
+        FrozenSet[str]: The triggers found.
+    """
+    lowered = email_content.lower()
+    return frozenset(trigger for trigger in FIELD_TRIGGERS if trigger in lowered)
+
 def initialize_ner_pipeline(logger: logging.Logger, config: Dict[str, Any]):
     """
     Initializes the NER pipeline with domain-specific fine-tuning.
@@ -19,14 +69,27 @@ def initialize_ner_pipeline(logger: logging.Logger, config: Dict[str, Any]):
     """
     try:
         logger.debug("Loading NER model and tokenizer.")
-        tokenizer = AutoTokenizer.from_pretrained(config['models']['ner']['repo_id'])
-        model = AutoModelForTokenClassification.from_pretrained(config['models']['ner']['repo_id'])
+        ner_config = config['models']['ner']
+        use_cuda = config['processing']['device'] == 'cuda' and torch.cuda.is_available()
+        tokenizer = AutoTokenizer.from_pretrained(ner_config['repo_id'])
+        model = None
+        if ner_config.get('backend') == 'onnx':
+            model = _load_onnx_ner_model(ner_config['repo_id'], use_cuda, logger)
+        if model is None:
+            model = AutoModelForTokenClassification.from_pretrained(ner_config['repo_id'])
+            if not use_cuda and ner_config.get('quantization') == 'int8':
+                model = torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+                logger.debug("NER linear layers quantized to INT8.")
+            device = 0 if use_cuda else -1
+        else:
+            # ONNX Runtime sessions are placed by their execution provider.
+            device = None
         ner_pipeline = pipeline(
             "ner",
             model=model,
             tokenizer=tokenizer,
-            aggregation_strategy=config['models']['ner'].get('aggregation_strategy', 'simple'),
-            device=0 if config['processing']['device'] == 'cuda' and torch.cuda.is_available() else -1
+            aggregation_strategy=ner_config.get('aggregation_strategy', 'simple'),
+            device=device,
         )
         logger.info("NER pipeline initialized successfully.")
         return ner_pipeline
@@ -34,6 +97,35 @@ def initialize_ner_pipeline(logger: logging.Logger, config: Dict[str, Any]):
         logger.error(f"Failed to initialize NER pipeline: {e}", exc_info=True)
         return None
 
+def _load_onnx_ner_model(repo_id: str, use_cuda: bool, logger: logging.Logger):
+    """
+    Exports the NER model to ONNX and loads it in an ONNX Runtime session with all
+    graph optimizations enabled.
+
+    Args:
+        repo_id (str): Hugging Face repository of the token-classification model.
+        use_cuda (bool): Whether to run on the CUDA execution provider.
+        logger (logging.Logger): Logger instance.
+
+    Returns:
+        The ONNX Runtime model, or None if optimum[onnxruntime] is not installed.
+    """
+    try:
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForTokenClassification
+    except ImportError:
+        logger.warning("NER backend 'onnx' requested but optimum[onnxruntime] is not installed.")
+        return None
+    session_options = ort.SessionOptions()
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session_options.intra_op_num_threads = os.cpu_count() or 1
+    provider = "CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider"
+    model = ORTModelForTokenClassification.from_pretrained(
+        repo_id, export=True, provider=provider, session_options=session_options
+    )
+    logger.info(f"Using ONNX Runtime ({provider}) for NER model '{repo_id}'.")
+    return model
+
 def perform_ner(email_content: str, ner_pipeline) -> Dict[str, Any]:
     """
     Perform Named Entity Recognition on the given email content.
@@ -48,63 +140,42 @@ def perform_ner(email_content: str, ner_pipeline) -> Dict[str, Any]:
     try:
         logging.debug("Starting NER process.")
         entities = ner_pipeline(email_content)
-        extracted_entities: Dict[str, Any] = {}
+        extracted_entities = defaultdict(lambda: defaultdict(list))
+        # The email is the same for every entity; look for the triggers once.
+        triggers = find_field_triggers(email_content)
         for entity in entities:
             label = entity.get("entity_group")
             word = entity.get("word").strip()
             score = entity.get("score", 0)
             if label and word and score > 0.85:  # Confidence threshold
-                section, field = map_entity_to_field(label, email_content)
+                section, field = map_entity_to_field(label, email_content, triggers)
                 if section and field:
-                    extracted_entities.setdefault(section, {}).setdefault(field, []).append(word)
+                    extracted_entities[section][field].append(word)
                     logging.debug(f"Extracted {label}: {word} with confidence {score:.2f}")
-        return extracted_entities
+        return {section: dict(fields) for section, fields in extracted_entities.items()}
     except Exception as e:
         logging.error(f"Error during NER processing: {e}", exc_info=True)
         return {}
 
-def map_entity_to_field(label: str, email_content: str) -> (Any, Any):
+def map_entity_to_field(
+    label: str, email_content: str, triggers: Optional[FrozenSet[str]] = None
+) -> (Any, Any):
     """
     Maps a detected entity to a specific section and field in the schema.
 
     Args:
         label (str): The entity label.
         email_content (str): The content of the email.
+        triggers (Optional[FrozenSet[str]]): Precomputed find_field_triggers(email_content).
 
     Returns:
         Tuple[Optional[str], Optional[str]]: The section and field names.
     """
-    if label == "PER":
-        if "insured" in email_content.lower():
-            return "Insured Information", "Name"
-        elif "adjuster" in email_content.lower():
-            return "Adjuster Information", "Adjuster Name"
-        elif "handler" in email_content.lower():
-            return "Requesting Party", "Handler"
-        elif "public adjuster" in email_content.lower():
-            return "Insured Information", "Public Adjuster"
-    elif label == "ORG":
-        if "insurance company" in email_content.lower():
-            return "Requesting Party", "Insurance Company"
-        elif "claims adjuster" in email_content.lower():
-            return "Adjuster Information", "Job Title"
-    elif label in ["LOC", "GPE"]:
-        if "loss location" in email_content.lower():
-            return "Insured Information", "Loss Address"
-        elif "address" in email_content.lower():
-            return "Adjuster Information", "Address"
-    elif label in ["DATE", "EVENT"]:
-        if "loss" in email_content.lower():
-            return "Assignment Information", "Date of Loss/Occurrence"
-        elif "incident" in email_content.lower():
-            return "Assignment Information", "Date of Loss/Occurrence"
-        elif "damage" in email_content.lower():
-            return "Assignment Information", "Cause of loss"
-    elif label == "PHONE":
-        if "contact number" in email_content.lower():
-            return "Insured Information", "Contact #"
-        elif "adjuster phone" in email_content.lower():
-            return "Adjuster Information", "Adjuster Phone Number"
-    elif label == "EMAIL":
+    if label == "EMAIL":
         return "Adjuster Information", "Adjuster Email"
+    if triggers is None:
+        triggers = find_field_triggers(email_content)
+    for trigger, target in LABEL_FIELD_RULES.get(label, ()):
+        if trigger in triggers:
+            return target
     return None, None
@@ -53,6 +53,11 @@ FOUND_MESSAGE = "Found %s: %s"
 FOUND_ADDITIONAL_PATTERN_MESSAGE = "Found %s using additional pattern: %s"
 NOT_FOUND_MESSAGE = "%s not found, set to 'N/A'"
 
+# Accepted values for yes/no and owner/tenant fields, and the yes/no fields themselves
+YES_NO_VALUES = frozenset({"yes", "no"})
+OWNER_TENANT_VALUES = frozenset({"owner", "tenant"})
+YES_NO_FIELDS = frozenset({RESIDENCE_OCCUPIED_DURING_LOSS, WAS_SOMEONE_HOME})
+
 
 class RuleBasedParser(BaseParser):
     """An improved and enhanced rule-based parser for comprehensive email parsing."""
@@ -808,7 +813,7 @@ class RuleBasedParser(BaseParser):
                 if key == OWNER_OR_TENANT:
                     value = (
                         value.capitalize()
-                        if value.lower() in ["owner", "tenant"]
+                        if value.lower() in OWNER_TENANT_VALUES
                         else "N/A"
                     )
                 data[key] = value if value else "N/A"
@@ -925,9 +930,9 @@ class RuleBasedParser(BaseParser):
                 if key == DATE_OF_LOSS_LABEL:
                     parsed_date = self.parse_date(value)
                     value = parsed_date if parsed_date else "N/A"
-                elif key in [RESIDENCE_OCCUPIED_DURING_LOSS, WAS_SOMEONE_HOME]:
+                elif key in YES_NO_FIELDS:
                     value = (
-                        value.capitalize() if value.lower() in ["yes", "no"] else "N/A"
+                        value.capitalize() if value.lower() in YES_NO_VALUES else "N/A"
                     )
                 data[key] = value if value else "N/A"
                 self.logger.debug(FOUND_MESSAGE, key, value)
@@ -940,10 +945,10 @@ class RuleBasedParser(BaseParser):
                     if value and key == DATE_OF_LOSS_LABEL:
                         parsed_date = self.parse_date(value)
                         value = parsed_date if parsed_date else "N/A"
-                    elif key in [RESIDENCE_OCCUPIED_DURING_LOSS, WAS_SOMEONE_HOME]:
+                    elif key in YES_NO_FIELDS:
                         value = (
                             value.capitalize()
-                            if value.lower() in ["yes", "no"]
+                            if value.lower() in YES_NO_VALUES
                             else "N/A"
                         )
                     data[key] = value if value else "N/A"
@@ -1,10 +1,38 @@
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
+import functools
+import itertools
 import logging
+import re
 from dataclasses import dataclass
 from copy import deepcopy
+from datetime import date as Date, datetime
 
 from src.utils.quickbase_schema import QUICKBASE_SCHEMA
 
+# Shared default for fields missing from the merge target; read-only, never mutated.
+_NA_LIST: List[str] = ["N/A"]
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_date(date: str) -> Optional[str]:
+    """
+    Normalizes a date string to 'YYYY-MM-DD', or returns None if it cannot be parsed.
+    """
+    # Already-normalized dates skip the datetime round trip; date.fromisoformat
+    # still rejects impossible days such as 2023-02-30.
+    if _ISO_DATE_RE.fullmatch(date):
+        try:
+            Date.fromisoformat(date)
+        except ValueError:
+            return None
+        return date
+    try:
+        return datetime.fromisoformat(date.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
 
 @dataclass
 class MergeChange:
@@ -28,10 +56,51 @@ class DataMerger:
     Keeps track of all changes made during the merge.
     """
 
+    # Fields the merged output must always contain, all defaulting to ["N/A"].
+    _REQUIRED_SECTIONS: Dict[str, List[str]] = {
+        "Requesting Party": [
+            "Insurance Company",
+            "Handler",
+            "Carrier Claim Number",
+        ],
+        "Insured Information": [
+            "Name",
+            "Contact #",
+            "Loss Address",
+            "Public Adjuster",
+            "Is the insured an Owner or a Tenant of the loss location?",
+        ],
+        "Adjuster Information": [
+            "Adjuster Name",
+            "Adjuster Phone Number",
+            "Adjuster Email",
+            "Job Title",
+            "Address",
+            "Policy #",
+        ],
+        "Assignment Information": [
+            "Date of Loss/Occurrence",
+            "Cause of loss",
+            "Facts of Loss",
+            "Loss Description",
+            "Residence Occupied During Loss",
+            "Was Someone home at time of damage",
+            "Repair or Mitigation Progress",
+            "Type",
+            "Inspection type",
+        ],
+        "Assignment Type": [
+            "Wind",
+            "Structural",
+            "Hail",
+            "Foundation",
+            "Other",
+        ],
+    }
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.changes: List[MergeChange] = []
-        self._seen_values: Set[str] = set()
 
     @staticmethod
     def ensure_list(value: Any) -> List[Any]:
@@ -78,15 +147,18 @@ class DataMerger:
                 return [email.lower().strip() for email in new_list if email != "N/A"]
         if any(v != "N/A" for v in new_list):
             existing_list = [v for v in existing_list if v != "N/A"]
-        self._seen_values.clear()
-        merged = []
-        for item in existing_list + new_list:
-            if item != "N/A":
-                item_str = str(item)
-                if item_str not in self._seen_values:
-                    self._seen_values.add(item_str)
-                    merged.append(item)
-        return merged if merged else ["N/A"]
+        candidates = [
+            v for v in itertools.chain(existing_list, new_list) if v != "N/A"
+        ]
+        if all(isinstance(v, str) for v in candidates):
+            merged = list(dict.fromkeys(candidates))
+        else:
+            # Non-string values (e.g. dicts) may be unhashable; dedup on str().
+            seen: Dict[str, Any] = {}
+            for item in candidates:
+                seen.setdefault(str(item), item)
+            merged = list(seen.values())
+        return merged or ["N/A"]
 
     def _format_dates(self, dates: List[str]) -> List[str]:
         """
@@ -98,16 +170,15 @@ class DataMerger:
         Returns:
             List[str]: List of formatted date strings.
         """
-        from datetime import datetime
-
         formatted = []
         for date in dates:
-            try:
-                if date != "N/A":
-                    dt = datetime.fromisoformat(date.replace("Z", "+00:00"))
-                    formatted.append(dt.strftime("%Y-%m-%d"))
-            except ValueError:
+            if date == "N/A":
+                continue
+            normalized = _normalize_date(date) if isinstance(date, str) else None
+            if normalized is None:
                 self.logger.warning(f"Invalid date format: {date}")
+            else:
+                formatted.append(normalized)
         return formatted if formatted else ["N/A"]
 
     def merge_parsed_data(
@@ -147,14 +218,14 @@ class DataMerger:
                                 )
                             )
                         if isinstance(fields, dict):
+                            section_result = result[section]
                             for field, value in fields.items():
-                                field_config = schema_config.get(field, {})
-                                old_value = result[section].get(field, ["N/A"])
+                                old_value = section_result.get(field, _NA_LIST)
                                 new_value = self.merge_field_values(
-                                    old_value, value, field_config
+                                    old_value, value, schema_config.get(field)
                                 )
                                 if old_value != new_value:
-                                    result[section][field] = new_value
+                                    section_result[field] = new_value
                                     self.changes.append(
                                         MergeChange(
                                             section=section,
@@ -235,7 +306,7 @@ class DataMerger:
                         exc_info=True,
                     )
                     continue
-            if self.changes:
+            if self.changes and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Merge changes:\n" + "\n".join(f"- {change}" for change in self.changes)
                 )
@@ -258,61 +329,17 @@ class DataMerger:
         Raises:
             ValueError: If validation fails.
         """
-        required_sections = {
-            "Requesting Party": {
-                "Insurance Company": list,
-                "Handler": list,
-                "Carrier Claim Number": list,
-            },
-            "Insured Information": {
-                "Name": list,
-                "Contact #": list,
-                "Loss Address": list,
-                "Public Adjuster": list,
-                "Is the insured an Owner or a Tenant of the loss location?": list,
-            },
-            "Adjuster Information": {
-                "Adjuster Name": list,
-                "Adjuster Phone Number": list,
-                "Adjuster Email": list,
-                "Job Title": list,
-                "Address": list,
-                "Policy #": list,
-            },
-            "Assignment Information": {
-                "Date of Loss/Occurrence": list,
-                "Cause of loss": list,
-                "Facts of Loss": list,
-                "Loss Description": list,
-                "Residence Occupied During Loss": list,
-                "Was Someone home at time of damage": list,
-                "Repair or Mitigation Progress": list,
-                "Type": list,
-                "Inspection type": list,
-            },
-            "Assignment Type": {
-                "Wind": list,
-                "Structural": list,
-                "Hail": list,
-                "Foundation": list,
-                "Other": list,
-            },
-        }
         try:
-            for section, fields in required_sections.items():
-                if section not in data:
+            for section, fields in self._REQUIRED_SECTIONS.items():
+                section_data = data.get(section)
+                if section_data is None:
                     self.logger.warning(f"Missing required section: {section}")
-                    data[section] = {}
-                for field, field_type in fields.items():
-                    if field not in data[section]:
-                        if field_type == list:
-                            data[section][field] = ["N/A"]
-                        else:
-                            data[section][field] = "N/A"
-                    if field_type == list and not isinstance(
-                        data[section][field], list
-                    ):
-                        data[section][field] = [data[section][field]]
+                    section_data = data[section] = {}
+                for field in fields:
+                    if field not in section_data:
+                        section_data[field] = ["N/A"]
+                    elif type(section_data[field]) is not list:
+                        section_data[field] = [section_data[field]]
             if "Assignment Type" in data and "Other" in data["Assignment Type"]:
                 other_data = data["Assignment Type"]["Other"]
                 if isinstance(other_data, list) and other_data:
@@ -1,9 +1,14 @@
 # src/parsers/enhanced_parser.py
 
+import contextlib
+import functools
+import gc
 import logging
 import os
 import asyncio
 import threading
+import time
+from collections import defaultdict
 from concurrent.futures import (
     ThreadPoolExecutor,
     TimeoutError as ConcurrentTimeoutError,
@@ -13,7 +18,7 @@ from typing import Any, Dict, Optional, Union, Callable, List, Tuple
 import torch
 from PIL import Image
 import psutil
-from jinja2 import Template
+from jinja2 import Environment, Template
 
 from src.parsers.base_parser import BaseParser
 from src.parsers.data_merger import DataMerger
@@ -22,7 +27,12 @@ from src.parsers.stages.validation_parsing import (
     validate_internal,
     validate_schema_internal,
 )
-from src.parsers.stages.donut_parsing import perform_donut_parsing, initialize_donut
+from src.parsers.stages.donut_parsing import (
+    PixelBufferPool,
+    initialize_donut,
+    perform_donut_parsing,
+)
+from src.parsers.stages.batching import close_pipeline
 from src.parsers.stages.model_based_parsing import (
     perform_model_based_parsing,
     initialize_model_parser,
@@ -38,9 +48,109 @@ REQUESTING_PARTY: str = "Requesting Party"
 INSURED_INFORMATION: str = "Insured Information"
 ASSIGNMENT_INFORMATION: str = "Assignment Information"
 
+_TEMPLATE_ENV = Environment(autoescape=False)
+
+@functools.lru_cache(maxsize=None)
+def _stage_key(stage_name: str) -> str:
+    """Config key for a stage display name, e.g. "Post Processing" -> "post_processing"."""
+    return stage_name.lower().replace(" ", "_")
+
+
+# Read once at import; it does not change for the life of the process.
+_CPU_COUNT: int = psutil.cpu_count(logical=True) or os.cpu_count() or 1
+
+
+def _is_on_cpu(model: Any) -> bool:
+    """Whether ``model``'s weights are on the CPU, judged by its first parameter."""
+    parameters = getattr(model, "parameters", None)
+    param = next(parameters(), None) if callable(parameters) else None
+    return param is None or param.device.type == "cpu"
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template(source: str) -> Template:
+    """Compile a prompt template once per distinct source string."""
+    return _TEMPLATE_ENV.from_string(source)
+
 
 class EnhancedParser(BaseParser):
     REQUIRED_ENV_VARS = ["HF_TOKEN", "HF_HOME"]
+    # Stages backed by generate(); they enforce their own timeout through max_time
+    # and run inline instead of on the executor, whose threads cannot be cancelled.
+    # max_time also bounds Donut preprocessing and the wait in the batching queue.
+    GENERATE_STAGES = frozenset(
+        ["Donut Parsing", "Text Extraction", "Validation", "Summarization"]
+    )
+    # Stage key -> method that reloads the stage's model. Post processing and
+    # JSON validation have no model and are not recoverable.
+    RECOVERY_METHODS = {
+        "donut_parsing": "_recover_donut_parsing",
+        "text_extraction": "_recover_llama",
+        "validation": "_recover_llama",
+        "summarization": "_recover_llama",
+    }
+    # Recoverable stage key -> model attributes that must be loaded afterwards.
+    RECOVERY_COMPONENTS = {
+        "donut_parsing": ("donut_model", "donut_processor"),
+        "text_extraction": ("llama_model",),
+        "validation": ("llama_model",),
+        "summarization": ("llama_model",),
+    }
+    # Donut form field name -> (section, QuickBase field).
+    DONUT_FIELD_MAPPING = {
+        "policy_number": (ADJUSTER_INFORMATION, "Policy #"),
+        "claim_number": (REQUESTING_PARTY, "Carrier Claim Number"),
+        "insured_name": (INSURED_INFORMATION, "Name"),
+        "loss_address": (INSURED_INFORMATION, "Loss Address"),
+        "adjuster_name": (ADJUSTER_INFORMATION, "Adjuster Name"),
+        "adjuster_phone": (ADJUSTER_INFORMATION, "Adjuster Phone Number"),
+        "adjuster_email": (ADJUSTER_INFORMATION, "Adjuster Email"),
+        "date_of_loss": (
+            ASSIGNMENT_INFORMATION,
+            "Date of Loss/Occurrence",
+        ),
+        "cause_of_loss": (ASSIGNMENT_INFORMATION, "Cause of loss"),
+        "loss_description": (ASSIGNMENT_INFORMATION, "Loss Description"),
+        "inspection_type": (ASSIGNMENT_INFORMATION, "Inspection type"),
+        "repair_progress": (
+            ASSIGNMENT_INFORMATION,
+            "Repair or Mitigation Progress",
+        ),
+        "residence_occupied": (
+            ASSIGNMENT_INFORMATION,
+            "Residence Occupied During Loss",
+        ),
+        "someone_home": (
+            ASSIGNMENT_INFORMATION,
+            "Was Someone home at time of damage",
+        ),
+        "type": (ASSIGNMENT_INFORMATION, "Type"),
+        "additional_instructions": (
+            "Additional details/Special Instructions",
+            "Details",
+        ),
+        "attachments": ("Attachment(s)", "Files"),
+        "owner_tenant": (
+            INSURED_INFORMATION,
+            "Is the insured an Owner or a Tenant of the loss location?",
+        ),
+    }
+    DONUT_BOOL_FIELDS = frozenset(["residence_occupied", "someone_home"])
+    DONUT_TRUE_VALUES = frozenset(["yes", "true", "1"])
+    # (model attribute, display name) pairs that cleanup moves off the GPU.
+    CLEANUP_MODELS = (
+        ("donut_model", "Donut model"),
+        ("donut_processor", "Donut processor"),
+        ("llama_model", "LLaMA model"),
+    )
+    # health_check() key -> model attribute, for components backed by one attribute.
+    HEALTH_COMPONENTS = (
+        ("llama_text_extraction", "llama_model"),
+        ("llama_validation", "llama_model"),
+        ("llama_summarization", "llama_model"),
+    )
+    # Seconds a health_check() result may be reused.
+    HEALTH_CACHE_TTL = 0.1
 
     def __init__(
         self,
@@ -55,14 +165,26 @@ class EnhancedParser(BaseParser):
         self.device: Optional[str] = None
         self.donut_processor = None
         self.donut_model = None
+        # Created with the Donut model once the device is known.
+        self._pixel_buffer_pool: Optional[PixelBufferPool] = None
         self.llama_model = None
-        self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.executor: Optional[ThreadPoolExecutor] = None
+        self.request_executor: Optional[ThreadPoolExecutor] = None
         self.data_merger: DataMerger = DataMerger(self.logger)
         self.timeouts = self._set_timeouts()
+        # Stage name -> resolved timeout, filled on first lookup.
+        self._stage_timeouts: Dict[str, int] = {}
+        # (monotonic timestamp, result) of the last health_check().
+        self._health_cache: Optional[Tuple[float, Dict[str, bool]]] = None
         self.input_type = None
-        self._initialize_event_loop()
+        # (prompt_config, data_points, rendered prompts) from the last render.
+        self._rendered_prompts: Optional[
+            Tuple[Dict[str, Any], Dict[str, Any], Dict[str, str]]
+        ] = None
         self._is_initialized = False
+        # Start psutil's CPU-time baseline so get_performance_metrics never has to
+        # sample over a blocking interval.
+        psutil.cpu_percent(interval=None)
 
     def _init_core_attributes(
         self,
@@ -76,29 +198,29 @@ class EnhancedParser(BaseParser):
         self.socketio = socketio
         self.sid = sid
 
-    def _initialize_event_loop(self) -> None:
-        """Initialize the asyncio event loop in a thread-safe manner."""
-        try:
-            if self.loop is None or self.loop.is_closed():
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-
-            self.logger.debug("Event loop initialized successfully")
-        except Exception as e:
-            self.logger.error("Failed to initialize asyncio loop", exc_info=True)
-            raise InitializationError(f"Asyncio loop initialization failed: {e}") from e
-
-        async def parse_async(
-            self,
-            email_content: Optional[str] = None,
-            document_image: Optional[Union[str, Image.Image]] = None,
-        ) -> Dict[str, Any]:
-            if self.loop is None:
-                self.logger.error("Asyncio event loop is not initialized.")
-                return {}
-            return await self.loop.run_in_executor(
-                self.executor, self.parse, email_content, document_image
+    async def parse_async(
+        self,
+        email_content: Optional[str] = None,
+        document_image: Optional[Union[str, Image.Image]] = None,
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        request_executor = self.request_executor
+        if request_executor is None:
+            # parse() may hold the lock while it loads models, so wait for it off
+            # the event loop thread.
+            request_executor = await loop.run_in_executor(
+                None, self._initialize_request_executor
             )
+        # Requests get their own pool so a parse() thread never waits on stage
+        # work queued behind other requests in the stage executor.
+        return await loop.run_in_executor(
+            request_executor, self.parse, email_content, document_image
+        )
+
+    def _initialize_request_executor(self) -> ThreadPoolExecutor:
+        with self.lock:
+            self._initialize_executor()
+            return self.request_executor
 
     @property
     def is_initialized(self) -> bool:
@@ -198,8 +320,6 @@ class EnhancedParser(BaseParser):
         except Exception as e:
             self.logger.error("Error during parsing: %s", e, exc_info=True)
             return self._handle_parsing_error(e, parsed_data)
-        finally:
-            self.cleanup_resources()
 
     def _detect_input_type(
         self,
@@ -219,17 +339,35 @@ class EnhancedParser(BaseParser):
 
 
     def _initialize_executor(self):
+        """Create the shared executors once; they are reused across parse() calls."""
         if not self.executor:
             self.executor = ThreadPoolExecutor(
-                max_workers=self._determine_thread_count()
+                max_workers=self._determine_thread_count(),
+                thread_name_prefix="parser-stage",
             )
             self.logger.debug("ThreadPoolExecutor initialized.")
+        if not self.request_executor:
+            self.request_executor = ThreadPoolExecutor(
+                max_workers=self._determine_thread_count(io_bound=True),
+                thread_name_prefix="parser-request",
+            )
 
     def _initialize_models(self, input_type: str) -> None:
         try:
+            if self.device is None:
+                self.device = Config.get_device()
+                if self.device == "cuda":
+                    self._enable_tf32()
+
+            # Loading is dominated by disk/hub I/O, so Donut loads on the executor
+            # while LLaMA loads here; startup takes the longer of the two.
+            donut_future = None
             if input_type in ["image", "both"] and not self.donut_model:
-                self.donut_processor, self.donut_model = self._initialize_with_retry(
-                    initialize_donut, self.logger, Config.get_model_config("donut")
+                donut_future = self.executor.submit(
+                    self._initialize_with_retry,
+                    initialize_donut,
+                    self.logger,
+                    Config.get_model_config("donut"),
                 )
 
             if input_type in ["text", "both"] and not self.llama_model:
@@ -240,13 +378,45 @@ class EnhancedParser(BaseParser):
                     prompt_templates=self._render_prompts(),
                 )
 
-            self.device = Config.get_device()
+            if donut_future is not None:
+                self.donut_processor, self.donut_model = donut_future.result()
+                if self.device == "cuda" and self._pixel_buffer_pool is None:
+                    self._pixel_buffer_pool = PixelBufferPool(self.device)
 
         except InitializationError:
             raise
         except Exception as e:
             self.logger.error("Failed to initialize models: %s", e, exc_info=True)
             raise InitializationError(f"Model initialization failed: {e}") from e
+        finally:
+            # Models may have been assigned even if a later load failed.
+            self._health_cache = None
+
+    def _autocast(self, model: Any = None) -> contextlib.AbstractContextManager:
+        """
+        Mixed-precision context for ``model``'s forward passes when
+        processing.enable_amp is set on CUDA. Half-precision weights keep their own
+        dtype so autocast never recasts them; FP32 models run in BF16 where
+        supported, FP16 otherwise. A no-op elsewhere.
+        """
+        if not getattr(self, "enable_amp", False) or self.device != "cuda":
+            return contextlib.nullcontext()
+        if isinstance(model, dict):
+            # initialize_model_parser returns {"model": pipeline, ...}
+            model = model.get("model")
+        model = getattr(model, "model", model)
+        dtype = getattr(model, "dtype", None)
+        if dtype not in (torch.float16, torch.bfloat16):
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        return torch.autocast(device_type="cuda", dtype=dtype)
+
+    def _enable_tf32(self) -> None:
+        """Allow TF32 matmuls/convolutions and cuDNN autotuning for all CUDA stages."""
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+        torch.set_float32_matmul_precision("high")
+        self.logger.debug("Enabled TF32 and cuDNN benchmark mode.")
 
     def _check_environment_variables(self) -> None:
         missing_vars = [var for var in self.REQUIRED_ENV_VARS if not os.getenv(var)]
@@ -282,14 +452,9 @@ class EnhancedParser(BaseParser):
                     attempt + 1,
                 )
                 return component
-            except (ValueError, OSError, TypeError) as e:
-                # Log each attempt failure
-                self.logger.warning(
-                    "Initialization attempt %d for %s failed: %s. Retrying...",
-                    attempt + 1,
-                    init_func.__name__,
-                    e,
-                )
+            except (ValueError, OSError) as e:
+                # Only hub/IO-style failures are worth retrying. Intermediate
+                # attempts log without a traceback; the final failure keeps it.
                 if attempt == max_retries - 1:
                     self.logger.error(
                         "Failed to initialize %s after %d attempts: %s",
@@ -301,17 +466,35 @@ class EnhancedParser(BaseParser):
                     raise InitializationError(
                         f"Initialization failed for {init_func.__name__}: {e}"
                     ) from e
-                torch.cuda.empty_cache()
+                self.logger.warning(
+                    "Initialization attempt %d for %s failed: %s. Retrying...",
+                    attempt + 1,
+                    init_func.__name__,
+                    e,
+                )
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
 
-    def _determine_thread_count(self) -> int:
-        cpu_count = psutil.cpu_count(logical=True)
-        available_memory_gb = psutil.virtual_memory().available / (1024**3)
+    def _determine_thread_count(self, io_bound: bool = False) -> int:
+        """
+        Size a thread pool. Stage work that is not generate() is Python-bound and
+        serializes on the GIL, so extra threads only add contention; request
+        threads mostly block on stages, so that pool can be wider. The
+        KEYSTONE_MAX_WORKERS environment variable caps both.
+        """
+        if io_bound:
+            thread_count = min(32, _CPU_COUNT * 4)
+        else:
+            thread_count = min(4, _CPU_COUNT)
 
-        thread_count = min(
-            16,
-            cpu_count * 2,
-            int(available_memory_gb * 2),
-        )
+        max_workers = os.getenv("KEYSTONE_MAX_WORKERS")
+        if max_workers:
+            try:
+                thread_count = min(thread_count, int(max_workers))
+            except ValueError:
+                self.logger.warning(
+                    "Ignoring invalid KEYSTONE_MAX_WORKERS value: %s", max_workers
+                )
 
         self.logger.debug("Determined thread count: %d", thread_count)
         return max(1, thread_count)
@@ -358,17 +541,24 @@ class EnhancedParser(BaseParser):
 
 
     def _render_prompts(self) -> Dict[str, str]:
-        prompts = {}
         prompt_config = (
             self.config.get("models", {}).get("llama", {}).get("prompt_templates", {})
         )
+        data_points = Config.get_data_points()
+        # Prompts only depend on the templates and data points; re-render only
+        # when either configuration object has been replaced.
+        cached = self._rendered_prompts
+        if cached and cached[0] is prompt_config and cached[1] is data_points:
+            return cached[2]
+        prompts = {}
         for task, template in prompt_config.items():
             if template:
-                data_points = Config.get_data_points()
-                template_obj = Template(template)
-                prompts[task] = template_obj.render(data_points=data_points)
+                prompts[task] = _compile_template(template).render(
+                    data_points=data_points
+                )
             else:
                 prompts[task] = ""
+        self._rendered_prompts = (prompt_config, data_points, prompts)
         return prompts
 
     def _get_parsing_stages(
@@ -448,8 +638,13 @@ class EnhancedParser(BaseParser):
         self.logger.info("Starting stage: %s", stage_name)
 
         try:
-            future = self.executor.submit(stage_method, **kwargs)
-            stage_result = future.result(timeout=self._get_stage_timeout(stage_name))
+            if stage_name in self.GENERATE_STAGES:
+                stage_result = stage_method(**kwargs)
+            else:
+                future = self.executor.submit(stage_method, **kwargs)
+                stage_result = future.result(
+                    timeout=self._get_stage_timeout(stage_name)
+                )
 
             if isinstance(stage_result, dict) and stage_result:
                 parsed_data = self.data_merger.merge_parsed_data(
@@ -467,29 +662,32 @@ class EnhancedParser(BaseParser):
             return parsed_data  # Return what we have so far
 
     def _get_stage_timeout(self, stage_name: str) -> int:
-        stage_key = stage_name.lower().replace(" ", "_")
-        return self.timeouts.get(stage_key, 60)
+        timeout = self._stage_timeouts.get(stage_name)
+        if timeout is None:
+            stage_key = _stage_key(stage_name)
+            if stage_key not in self.timeouts:
+                stage_key = f"llama_{stage_key}"
+            timeout = self._stage_timeouts[stage_name] = self.timeouts.get(stage_key, 60)
+        return timeout
+
+    @staticmethod
+    def _record_issue(parsed_data: Dict[str, Any], message: str) -> None:
+        parsed_data.setdefault("validation_issues", []).append(message)
 
     def _handle_parsing_error(
         self, error: Exception, parsed_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         self.logger.error("Parsing process failed: %s", error, exc_info=True)
-        parsed_data["validation_issues"] = parsed_data.get("validation_issues", []) + [
-            str(error)
-        ]
+        self._record_issue(parsed_data, str(error))
         return parsed_data
 
     def _handle_stage_error(
         self, stage_name: str, error: Exception, parsed_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         if isinstance(error, (ConcurrentTimeoutError, ParsingError, ValidationError)):
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(error)]
+            self._record_issue(parsed_data, str(error))
         else:
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [f"Unexpected error in stage '{stage_name}': {error}"]
+            self._record_issue(parsed_data, f"Unexpected error in stage '{stage_name}': {error}")
         return parsed_data
 
     def _stage_email_parsing(
@@ -529,14 +727,17 @@ class EnhancedParser(BaseParser):
                 )
                 return {}
 
-            donut_output = perform_donut_parsing(
-                document_image=document_image,
-                processor=self.donut_processor,
-                model=self.donut_model,
-                device=self.device,
-                logger=self.logger,
-                config=self.config,
-            )
+            with self._autocast(self.donut_model):
+                donut_output = perform_donut_parsing(
+                    document_image=document_image,
+                    processor=self.donut_processor,
+                    model=self.donut_model,
+                    device=self.device,
+                    logger=self.logger,
+                    config=self.config,
+                    max_time=self._get_stage_timeout("Donut Parsing"),
+                    buffer_pool=self._pixel_buffer_pool,
+                )
 
             if not donut_output:
                 self.logger.warning("Donut Parsing returned empty output.")
@@ -571,16 +772,20 @@ class EnhancedParser(BaseParser):
                 self.logger.warning("No prompt template for Text Extraction.")
                 return {}
 
-            parsing_result = perform_model_based_parsing(
-                prompt, self.llama_model, self.logger
-            )
+            with self._autocast(self.llama_model):
+                parsing_result = perform_model_based_parsing(
+                    prompt,
+                    self.llama_model,
+                    self.logger,
+                    max_time=self._get_stage_timeout("Text Extraction"),
+                )
 
             # Assuming 'structured_data' contains the extracted fields
             structured_data = parsing_result.get("structured_data", {})
             metadata = parsing_result.get("metadata", {})
 
             # Optionally, store metadata if needed
-            self.logger.debug(f"Metadata from parsing: {metadata}")
+            self.logger.debug("Metadata from parsing: %s", metadata)
 
             return structured_data
         except ParsingError as pe:
@@ -612,9 +817,13 @@ class EnhancedParser(BaseParser):
                 return parsed_data
 
             # Assuming validation might update 'parsed_data' with validation results
-            validation_result = perform_model_based_parsing(
-                prompt, self.llama_model, self.logger
-            )
+            with self._autocast(self.llama_model):
+                validation_result = perform_model_based_parsing(
+                    prompt,
+                    self.llama_model,
+                    self.logger,
+                    max_time=self._get_stage_timeout("Validation"),
+                )
 
             # Merge validation results into parsed_data
             parsed_data.update(validation_result.get("structured_data", {}))
@@ -623,9 +832,7 @@ class EnhancedParser(BaseParser):
             return parsed_data
         except (ValueError, OSError) as e:
             self.logger.error("ValidationError during Validation stage: %s", e)
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
             raise ValidationError(f"Validation failed: {e}") from e
         except Exception as e:
             self.logger.error(
@@ -633,9 +840,7 @@ class EnhancedParser(BaseParser):
                 e,
                 exc_info=True,
             )
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
             raise ValidationError(f"Validation failed: {e}") from e
 
     def _stage_summarization(
@@ -660,9 +865,13 @@ class EnhancedParser(BaseParser):
                 self.logger.warning("No prompt template for Summarization.")
                 return
 
-            summary = perform_model_based_parsing(
-                prompt, self.llama_model["model"], self.logger
-            )
+            with self._autocast(self.llama_model):
+                summary = perform_model_based_parsing(
+                    prompt,
+                    self.llama_model["model"],
+                    self.logger,
+                    max_time=self._get_stage_timeout("Summarization"),
+                )
             if summary:
                 parsed_data["summary"] = summary
                 self.logger.debug("Summarization Result: %s", parsed_data["summary"])
@@ -687,17 +896,13 @@ class EnhancedParser(BaseParser):
             return post_process_parsed_data(parsed_data, self.logger)
         except (ValueError, OSError) as e:
             self.logger.error("Error during Post Processing stage: %s", e)
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
             raise ParsingError(f"Post Processing failed: {e}") from e
         except Exception as e:
             self.logger.error(
                 "Unexpected error during Post Processing stage: %s", e, exc_info=True
             )
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
             raise ParsingError(f"Post Processing failed: {e}") from e
 
     def _stage_json_validation(
@@ -714,76 +919,35 @@ class EnhancedParser(BaseParser):
                 self.logger.info("JSON validation passed.")
             else:
                 self.logger.error("JSON validation failed: %s", error_message)
-                parsed_data["validation_issues"] = parsed_data.get(
-                    "validation_issues", []
-                ) + [error_message]
+                self._record_issue(parsed_data, error_message)
         except ValidationError as ve:
             self.logger.error("ValidationError during JSON validation: %s", ve)
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(ve)]
+            self._record_issue(parsed_data, str(ve))
             raise
         except Exception as e:
             self.logger.error(
                 "Unexpected error during JSON validation: %s", e, exc_info=True
             )
-            parsed_data["validation_issues"] = parsed_data.get(
-                "validation_issues", []
-            ) + [str(e)]
+            self._record_issue(parsed_data, str(e))
             raise ValidationError(f"JSON Validation failed: {e}") from e
 
     def map_donut_output_to_schema(self, donut_json: Dict[str, Any]) -> Dict[str, Any]:
-        mapped_data: Dict[str, Any] = {}
+        mapped_data: Dict[str, Dict[str, List[Any]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        field_mapping = self.DONUT_FIELD_MAPPING
+        bool_fields = self.DONUT_BOOL_FIELDS
         try:
-            field_mapping = {
-                "policy_number": (ADJUSTER_INFORMATION, "Policy #"),
-                "claim_number": (REQUESTING_PARTY, "Carrier Claim Number"),
-                "insured_name": (INSURED_INFORMATION, "Name"),
-                "loss_address": (INSURED_INFORMATION, "Loss Address"),
-                "adjuster_name": (ADJUSTER_INFORMATION, "Adjuster Name"),
-                "adjuster_phone": (ADJUSTER_INFORMATION, "Adjuster Phone Number"),
-                "adjuster_email": (ADJUSTER_INFORMATION, "Adjuster Email"),
-                "date_of_loss": (
-                    ASSIGNMENT_INFORMATION,
-                    "Date of Loss/Occurrence",
-                ),
-                "cause_of_loss": (ASSIGNMENT_INFORMATION, "Cause of loss"),
-                "loss_description": (ASSIGNMENT_INFORMATION, "Loss Description"),
-                "inspection_type": (ASSIGNMENT_INFORMATION, "Inspection type"),
-                "repair_progress": (
-                    ASSIGNMENT_INFORMATION,
-                    "Repair or Mitigation Progress",
-                ),
-                "residence_occupied": (
-                    ASSIGNMENT_INFORMATION,
-                    "Residence Occupied During Loss",
-                ),
-                "someone_home": (
-                    ASSIGNMENT_INFORMATION,
-                    "Was Someone home at time of damage",
-                ),
-                "type": (ASSIGNMENT_INFORMATION, "Type"),
-                "additional_instructions": (
-                    "Additional details/Special Instructions",
-                    "Details",
-                ),
-                "attachments": ("Attachment(s)", "Files"),
-                "owner_tenant": (
-                    INSURED_INFORMATION,
-                    "Is the insured an Owner or a Tenant of the loss location?",
-                ),
-            }
             for item in donut_json.get("form", []):
                 field_name = item.get("name")
-                field_value = item.get("value")
-                if field_name in field_mapping:
-                    section, qb_field = field_mapping[field_name]
-                    if field_name in ["residence_occupied", "someone_home"]:
-                        field_value = field_value.lower() in ["yes", "true", "1"]
-                    mapped_data.setdefault(section, {}).setdefault(qb_field, []).append(
-                        field_value
-                    )
-            return mapped_data
+                target = field_mapping.get(field_name)
+                if target is not None:
+                    section, qb_field = target
+                    field_value = item.get("value")
+                    if field_name in bool_fields:
+                        field_value = field_value.lower() in self.DONUT_TRUE_VALUES
+                    mapped_data[section][qb_field].append(field_value)
+            return {section: dict(fields) for section, fields in mapped_data.items()}
         except ValueError as ve:
             self.logger.error(f"ValueError during Donut mapping: {ve}")
             raise ValidationError(f"Donut mapping failed: {ve}") from ve
@@ -791,15 +955,33 @@ class EnhancedParser(BaseParser):
             self.logger.error(f"Error during Donut mapping: {e}", exc_info=True)
             raise ValidationError(f"Donut mapping failed: {e}") from e
 
-    def cleanup_resources(self):
-        """Clean up resources including the event loop."""
+    def cleanup_resources(self, release_cuda_cache: bool = False):
+        """
+        Clean up models and executors.
+
+        ``release_cuda_cache`` also drops the parser's model references and returns
+        PyTorch's cached CUDA blocks to the driver. The sweep is expensive and only
+        useful when another process or framework needs the GPU memory, so it is off
+        by default; the parser must be re-initialized afterwards.
+        """
         self.logger.info("Starting resource cleanup.")
         cleanup_errors = []
+        self._health_cache = None
 
         try:
             with self.lock:
                 self._cleanup_models(cleanup_errors)
                 self._cleanup_executor(cleanup_errors)
+                self._close_llama_pipeline()
+                if release_cuda_cache and torch.cuda.is_available():
+                    # empty_cache can only return blocks no tensor still references.
+                    for attr, _ in self.CLEANUP_MODELS:
+                        setattr(self, attr, None)
+                    self._pixel_buffer_pool = None
+                    gc.collect()
+                    torch.cuda.synchronize()
+                    torch.cuda.empty_cache()
+                    self.logger.debug("Released cached CUDA memory.")
 
             if cleanup_errors:
                 self.logger.warning("Cleanup completed with errors: %s", cleanup_errors)
@@ -811,19 +993,23 @@ class EnhancedParser(BaseParser):
             raise
 
     def _cleanup_models(self, cleanup_errors: List[str]):
-        models_to_cleanup = [
-            (self.donut_model, "Donut model"),
-            (self.donut_processor, "Donut processor"),
-            (self.llama_model, "LLaMA model"),
-        ]
+        if not torch.cuda.is_available():
+            # Without CUDA every model already lives on the CPU.
+            return
 
-        for model, name in models_to_cleanup:
-            if model is not None:
+        # Issue each device-to-host copy on its own stream so they overlap on
+        # the PCIe bus, then wait for all of them once.
+        for attr, name in self.CLEANUP_MODELS:
+            model = getattr(self, attr, None)
+            if isinstance(model, dict):
+                # initialize_model_parser returns {"model": pipeline, ...}
+                model = model.get("model")
+            if hasattr(model, "model"):
+                model = model.model
+            if model is not None and hasattr(model, "to") and not _is_on_cpu(model):
                 try:
-                    if hasattr(model, "model"):
-                        model.model.cpu()
-                    elif hasattr(model, "to"):
-                        model.to("cpu")
+                    with torch.cuda.stream(torch.cuda.Stream()):
+                        model.to("cpu", non_blocking=True)
                 except ValueError as ve:
                     error_msg = f"ValueError moving {name} to CPU: {ve}"
                     self.logger.error(error_msg)
@@ -841,18 +1027,35 @@ class EnhancedParser(BaseParser):
                         exc_info=True,
                     )
                     cleanup_errors.append(error_msg)
+        torch.cuda.synchronize()
 
     def _cleanup_executor(self, cleanup_errors: List[str]):
+        if self.request_executor:
+            try:
+                self.request_executor.shutdown(wait=True)
+                self.request_executor = None
+            except Exception as e:
+                error_msg = f"Error during request executor shutdown: {e}"
+                self.logger.error(error_msg)
+                cleanup_errors.append(error_msg)
         if self.executor:
             try:
                 self.executor.shutdown(wait=True)
+                self.executor = None
                 self.logger.debug("Executor shutdown successfully.")
             except Exception as e:
                 error_msg = f"Error during executor shutdown: {e}"
                 self.logger.error(error_msg)
                 cleanup_errors.append(error_msg)
 
+    def _close_llama_pipeline(self):
+        # Stops the batching worker thread, which otherwise keeps the model alive.
+        llama_model = getattr(self, "llama_model", None)
+        if isinstance(llama_model, dict):
+            close_pipeline(llama_model.get("model"))
+
     def _unload_models(self):
+        self._close_llama_pipeline()
         models_to_unload = [
             "donut_model",
             "donut_processor",
@@ -864,31 +1067,30 @@ class EnhancedParser(BaseParser):
             if model is not None:
                 delattr(self, model_attr)
                 self.logger.debug(f"Unloaded {model_attr} from memory.")
-        torch.cuda.empty_cache()
-        self.logger.debug("Cleared CUDA cache.")
+        self._pixel_buffer_pool = None
+        self._health_cache = None
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+            self.logger.debug("Cleared CUDA cache.")
 
     def recover_from_failure(self, stage: str) -> bool:
         self.logger.warning("Attempting to recover from %s failure", stage)
 
-        recoverable_stages = {
-            "donut_parsing": lambda: self._recover_donut_parsing(),
-            "text_extraction": lambda: self._recover_llama(),
-            "validation": lambda: self._recover_llama(),
-            "summarization": lambda: self._recover_llama(),
-            "post_processing": None,
-            "json_validation": None,
-        }
-
-        stage_key = stage.lower().replace(" ", "_")
+        stage_key = _stage_key(stage)
 
-        recovery_action = recoverable_stages.get(stage_key)
-        if recovery_action:
+        recovery_method = self.RECOVERY_METHODS.get(stage_key)
+        if recovery_method:
             try:
-                recovery_action()
+                getattr(self, recovery_method)()
+                self._health_cache = None
                 self._initialize_executor()
                 self._initialize_models(self.input_type)
-                health = self.health_check()
-                recovery_successful = health.get(stage_key, False)
+                # Only the recovered stage's models matter; an unrelated model that
+                # is still missing should not read as a failed recovery.
+                recovery_successful = all(
+                    getattr(self, attr, None) is not None
+                    for attr in self.RECOVERY_COMPONENTS[stage_key]
+                )
                 if recovery_successful:
                     self.logger.info("Successfully recovered from %s failure", stage)
                 else:
@@ -912,15 +1114,19 @@ class EnhancedParser(BaseParser):
         return False
 
 
+    # Recovery reloads with the same model configs as _initialize_models, so its
+    # follow-up call finds the models present and does not load them again.
     def _recover_donut_parsing(self):
-        self.donut_processor, self.donut_model = initialize_donut(
-            self.logger, self.config
+        self.donut_processor, self.donut_model = self._initialize_with_retry(
+            initialize_donut, self.logger, Config.get_model_config("donut")
         )
 
     def _recover_llama(self):
-        self.llama_model = initialize_model_parser(
+        self._close_llama_pipeline()
+        self.llama_model = self._initialize_with_retry(
+            initialize_model_parser,
             self.logger,
-            self.config,
+            Config.get_model_config("llama"),
             prompt_templates=self._render_prompts(),
         )
 
@@ -929,14 +1135,17 @@ class EnhancedParser(BaseParser):
         email_content: Optional[str] = None,
         document_image: Optional[Union[str, Image.Image]] = None,
     ) -> bool:
-        if not email_content and not document_image:
-            self.logger.error("No input provided.")
+        if email_content is not None and not isinstance(email_content, str):
+            self.logger.error("Invalid email_content type: %s", type(email_content))
             return False
-        if document_image and not isinstance(document_image, (str, Image.Image)):
+        if document_image is not None and not isinstance(
+            document_image, (str, Image.Image)
+        ):
             self.logger.error("Invalid document_image type: %s", type(document_image))
             return False
-        if email_content and not isinstance(email_content, str):
-            self.logger.error("Invalid email_content type: %s", type(email_content))
+        # Both are now None, str or Image, so truthiness is a cheap emptiness check.
+        if not email_content and not document_image:
+            self.logger.error("No input provided.")
             return False
         return True
 
@@ -949,7 +1158,8 @@ class EnhancedParser(BaseParser):
     def get_performance_metrics(self) -> Dict[str, Any]:
         metrics = {
             "memory_usage": self._check_memory_usage(),
-            "cpu_usage_percent": psutil.cpu_percent(interval=1),
+            # Non-blocking: usage since the previous call (primed in __init__).
+            "cpu_usage_percent": psutil.cpu_percent(interval=None),
             "model_status": self.health_check(),
             "active_threads": self.max_workers,
             "processing_times": {
@@ -966,23 +1176,35 @@ class EnhancedParser(BaseParser):
     def _check_memory_usage(self) -> Dict[str, float]:
         memory_info = {}
         if torch.cuda.is_available():
+            # One allocator snapshot instead of three separate queries.
+            stats = torch.cuda.memory_stats()
             memory_info["cuda"] = {
-                "allocated": torch.cuda.memory_allocated() / 1024**2,
-                "cached": torch.cuda.memory_reserved() / 1024**2,
-                "max_allocated": torch.cuda.max_memory_allocated() / 1024**2,
+                "allocated": stats.get("allocated_bytes.all.current", 0) / 1024**2,
+                "cached": stats.get("reserved_bytes.all.current", 0) / 1024**2,
+                "max_allocated": stats.get("allocated_bytes.all.peak", 0) / 1024**2,
             }
         return memory_info
 
     def health_check(self) -> Dict[str, bool]:
+        # Metrics endpoints poll this back-to-back; reuse a result that is only
+        # HEALTH_CACHE_TTL seconds old. Model loading, recovery and cleanup
+        # invalidate it.
+        cached = self._health_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.HEALTH_CACHE_TTL:
+            # A copy, so a caller mutating its result cannot alter the cache.
+            return dict(cached[1])
         health = {
+            # Donut needs both its processor and its model.
             "donut_parsing": self.donut_model is not None
             and self.donut_processor is not None,
-            "llama_text_extraction": self.llama_model is not None,
-            "llama_validation": self.llama_model is not None,
-            "llama_summarization": self.llama_model is not None,
         }
+        health.update(
+            (key, getattr(self, attr) is not None) for key, attr in self.HEALTH_COMPONENTS
+        )
         self.logger.debug("Health check status: %s", health)
-        return health
+        self._health_cache = (now, health)
+        return dict(health)
 
     @property
     def max_workers(self) -> int:
@@ -1,11 +1,52 @@
 # src/parsers/parser_helpers.py
 
+import functools
 import re
+from datetime import datetime
 from typing import Any
 import dateutil.parser
 import phonenumbers
+try:
+    import ciso8601
+except ImportError:  # optional speedup for ISO 8601 dates
+    ciso8601 = None
 from PIL import Image
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_ADDRESS_COMMA_RE = re.compile(r"\s*,\s*")
+# Trailing two-letter state, optionally followed by a ZIP / ZIP+4.
+_ADDRESS_STATE_RE = re.compile(r"\b([A-Za-z]{2})\b\s*(\d{5}(?:-\d{4})?)?$")
+
+# Formats most claim dates arrive in; tried with strptime before dateutil.
+DATE_FAST_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y")
+
+
+def parse_date(date_string: str) -> datetime:
+    """
+    Parses a date string, trying ciso8601 (when installed) and the common formats
+    in DATE_FAST_FORMATS before falling back to dateutil.
+
+    Args:
+        date_string (str): The date string to parse.
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError, TypeError, OverflowError: If the string cannot be parsed.
+    """
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(date_string)
+        except ValueError:
+            pass
+    for fmt in DATE_FAST_FORMATS:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+    return dateutil.parser.parse(date_string)
+
 
 def format_date(date_string: str) -> str:
     """
@@ -17,13 +58,25 @@ def format_date(date_string: str) -> str:
     Returns:
         str: The formatted date or 'N/A'.
     """
+    # Only strings are memoized; anything else may be unhashable.
+    if isinstance(date_string, str):
+        return _format_date_cached(date_string)
+    return _format_date(date_string)
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_date_cached(date_string: str) -> str:
+    return _format_date(date_string)
+
+
+def _format_date(date_string: Any) -> str:
     if date_string == "N/A":
         return date_string
     try:
-        parsed_date = dateutil.parser.parse(date_string)
+        parsed_date = parse_date(date_string)
         formatted_date = parsed_date.strftime("%Y-%m-%d")
         return formatted_date
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return "N/A"
 
 
@@ -83,10 +136,9 @@ def format_address(address: str) -> str:
     """
     if not isinstance(address, str):
         return address
-    address = re.sub(r"\s+", " ", address.strip())
-    address = re.sub(r"\s*,\s*", ", ", address)
-    state_pattern = r"\b([A-Za-z]{2})\b\s*(\d{5}(?:-\d{4})?)?$"
-    match = re.search(state_pattern, address)
+    address = _WHITESPACE_RE.sub(" ", address.strip())
+    address = _ADDRESS_COMMA_RE.sub(", ", address)
+    match = _ADDRESS_STATE_RE.search(address)
     if match:
         state = match.group(1)
         if len(state) == 2:
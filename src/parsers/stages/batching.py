@@ -0,0 +1,199 @@
+# src/parsers/stages/batching.py
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as ConcurrentTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+
+# (inputs, kwargs, caller's CUDA autocast dtype or None, monotonic deadline or None, future)
+_Item = Tuple[Any, Dict[str, Any], Optional[torch.dtype], Optional[float], Future]
+
+# Queued by close() to stop the worker thread.
+_STOP: Any = object()
+
+
+class BatchedPipelineWrapper:
+    """
+    Coalesces concurrent single-input calls to a HuggingFace pipeline into one
+    batched forward pass.
+
+    Callers use the wrapper exactly like the pipeline: ``wrapper(text, **kwargs)``
+    blocks until the result for ``text`` is available. A background thread drains
+    the queue, waiting at most ``max_wait_ms`` for more requests, and runs every
+    queued input that shares the same keyword arguments as a single batch. The
+    caller's CUDA autocast state is carried over to the worker thread, since
+    autocast is thread-local.
+
+    A ``max_time`` keyword is the caller's whole budget, queueing included: a
+    request still queued when it runs out is withdrawn with a TimeoutError, and a
+    batch generates for no longer than its earliest deadline allows. ``close()`` stops the worker thread so neither it
+    nor the pipeline it references outlives the owner; the next call starts a
+    new one.
+    """
+
+    def __init__(
+        self,
+        pipeline: Any,
+        logger: logging.Logger,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+    ):
+        self.pipeline = pipeline
+        self.logger = logger
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue: "queue.Queue[_Item]" = queue.Queue()
+        self._pending: List[_Item] = []
+        # Orders submissions against close() so nothing is queued after _STOP.
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def __call__(self, inputs: Any, **kwargs) -> Any:
+        # Lists are already batched by the caller; pass them straight through.
+        if isinstance(inputs, list) or self.max_batch_size == 1:
+            return self.pipeline(inputs, **kwargs)
+        # max_time differs per request, so it is not part of the batching key.
+        max_time = kwargs.pop("max_time", None)
+        deadline = None if max_time is None else time.monotonic() + max_time
+        future: Future = Future()
+        amp_dtype = torch.get_autocast_gpu_dtype() if torch.is_autocast_enabled() else None
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="BatchedPipelineWorker", daemon=True
+                )
+                self._worker.start()
+            self._queue.put((inputs, kwargs, amp_dtype, deadline, future))
+        try:
+            return future.result(timeout=max_time)
+        except ConcurrentTimeoutError:
+            if future.cancel():
+                raise
+            # Already generating; generate() stops itself at the deadline.
+            return future.result()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose model, tokenizer, etc. of the wrapped pipeline.
+        if name == "pipeline":
+            raise AttributeError(name)
+        return getattr(self.pipeline, name)
+
+    def close(self) -> None:
+        """Stop the worker thread after it has served every queued request."""
+        with self._lock:
+            if self._worker is None:
+                return
+            self._queue.put(_STOP)
+            self._worker.join()
+            self._worker = None
+
+    def _next_item(self, timeout: Optional[float]) -> Optional[_Item]:
+        if self._pending:
+            return self._pending.pop(0)
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _collect_batch(self) -> Optional[List[_Item]]:
+        first = self._next_item(timeout=None)
+        if first is _STOP:
+            return None
+        batch = [first]
+
+        # Only inputs with identical generation arguments and precision can
+        # share a forward pass.
+        def shares_pass(item: _Item) -> bool:
+            return item is not _STOP and item[1] == first[1] and item[2] == first[2]
+
+        # Requests deferred by earlier batches join first, in arrival order.
+        deferred = []
+        for item in self._pending:
+            if len(batch) < self.max_batch_size and shares_pass(item):
+                batch.append(item)
+            else:
+                deferred.append(item)
+        self._pending = deferred
+        if any(item is _STOP for item in deferred):
+            # Nothing is queued after _STOP; serve what is left, then stop.
+            return batch
+
+        # max_wait bounds the whole collection, not each wait for one more input.
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if shares_pass(item):
+                batch.append(item)
+            else:
+                self._pending.append(item)
+                if item is _STOP:
+                    break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            # Drop requests whose callers timed out while they were queued.
+            batch = [item for item in batch if item[4].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            texts = [item[0] for item in batch]
+            _, kwargs, amp_dtype, _, _ = batch[0]
+            deadlines = [item[3] for item in batch if item[3] is not None]
+            if deadlines:
+                kwargs = dict(kwargs, max_time=max(0.0, min(deadlines) - time.monotonic()))
+            try:
+                with torch.autocast(
+                    device_type="cuda",
+                    dtype=amp_dtype or torch.float16,
+                    enabled=amp_dtype is not None,
+                ):
+                    outputs = self.pipeline(texts, batch_size=len(texts), **kwargs)
+                if len(outputs) != len(batch):
+                    raise RuntimeError(
+                        f"Pipeline returned {len(outputs)} results for a batch of {len(batch)}"
+                    )
+            except Exception as e:
+                self.logger.error("Batched pipeline call failed: %s", e, exc_info=True)
+                for *_, future in batch:
+                    future.set_exception(e)
+                continue
+            self.logger.debug("Ran batched pipeline call with %d inputs", len(batch))
+            for (*_, future), output in zip(batch, outputs):
+                # Match the shape of a single-input call, which always returns a list.
+                future.set_result(output if isinstance(output, list) else [output])
+
+
+def close_pipeline(pipeline: Any) -> None:
+    """Stop the batching worker of ``pipeline`` if it is a BatchedPipelineWrapper."""
+    if isinstance(pipeline, BatchedPipelineWrapper):
+        pipeline.close()
+
+
+def wrap_pipeline(pipeline: Any, logger: logging.Logger, batching_config: Optional[Dict[str, Any]] = None) -> Any:
+    """Wrap ``pipeline`` in a BatchedPipelineWrapper unless batching is disabled."""
+    batching_config = batching_config or {}
+    if not batching_config.get("enabled", True):
+        return pipeline
+    tokenizer = getattr(pipeline, "tokenizer", None)
+    if tokenizer is not None:
+        # Batched generation pads to the longest input in the batch.
+        if tokenizer.pad_token_id is None:
+            tokenizer.pad_token_id = tokenizer.eos_token_id
+        if getattr(pipeline, "task", None) == "text-generation":
+            tokenizer.padding_side = "left"
+    return BatchedPipelineWrapper(
+        pipeline,
+        logger,
+        max_batch_size=batching_config.get("max_batch_size", 16),
+        max_wait_ms=batching_config.get("max_wait_ms", 5),
+    )
@@ -6,6 +6,8 @@ import torch
 import json
 import re
 
+from src.parsers.stages.batching import wrap_pipeline
+from src.parsers.stages.optimization import optimize_for_inference
 from src.utils.quickbase_schema import QUICKBASE_SCHEMA
 
 
@@ -36,6 +38,13 @@ def initialize_model_parser(logger: logging.Logger, config: Dict[str, Any], prom
             torch_dtype=torch.float16 if config.get("llama", {}).get("torch_dtype") == "float16" else torch.float32,
             cache_dir=config.get("models", {}).get("cache_dir", ".cache"),
         )
+        llama_pipeline.model = optimize_for_inference(
+            llama_pipeline.model,
+            logger,
+            config,
+            "cuda" if torch.cuda.is_available() else "cpu",
+        )
+        llama_pipeline = wrap_pipeline(llama_pipeline, logger, config.get("batching"))
         logger.info("LLaMA model initialized successfully.")
         return {"model": llama_pipeline, "prompt_templates": prompt_templates, "field_types": field_types}
     except Exception as e:
@@ -59,15 +68,17 @@ def extract_json_from_llama_output(text: str, logger: logging.Logger) -> Dict[st
     return {}
 
 
-def perform_model_based_parsing(prompt: str, llama_model: Any, logger: logging.Logger) -> Dict[str, Any]:
+def perform_model_based_parsing(prompt: str, llama_model: Any, logger: logging.Logger, max_time: Optional[float] = None) -> Dict[str, Any]:
     try:
         logger.debug("Executing model-based parsing with prompt")
-        result = llama_model['model'](
-            prompt, 
-            max_length=llama_model['model'].config.max_length,
-            do_sample=True,
-            temperature=0.1  # Lower temperature for more structured output
-        )
+        with torch.inference_mode():
+            result = llama_model['model'](
+                prompt, 
+                max_length=llama_model['model'].config.max_length,
+                do_sample=True,
+                temperature=0.1,  # Lower temperature for more structured output
+                max_time=max_time,  # generate() stops itself once the stage budget is spent
+            )
         
         json_data = {}
         for entry in result:
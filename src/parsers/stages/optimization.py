@@ -0,0 +1,40 @@
+# src/parsers/stages/optimization.py
+
+import logging
+from typing import Any, Dict
+
+import torch
+
+
+def optimize_for_inference(model: Any, logger: logging.Logger, model_config: Dict[str, Any], device: str) -> Any:
+    """
+    Applies the opt-in inference optimizations from ``model_config`` to an eval-mode
+    model and returns the model to use.
+
+    On CUDA, ``compile: true`` wraps the forward pass in torch.compile with dynamic
+    shapes, so batched calls of varying size do not trigger recompiles. On CPU,
+    ``quantization: int8`` swaps every nn.Linear for a dynamically quantized INT8
+    version, and otherwise ``ipex: true`` runs the model through Intel Extension
+    for PyTorch when it is installed. All are off by default so compile time and
+    any accuracy cost are only paid when asked for.
+    """
+    if device == "cuda":
+        if model_config.get("compile", False) and hasattr(torch, "compile"):
+            # Default mode, not "reduce-overhead": CUDA graphs are captured per input
+            # shape, and batch size and sequence length change from call to call.
+            model.forward = torch.compile(model.forward, dynamic=True, fullgraph=False)
+            logger.debug("%s forward pass compiled with torch.compile.", type(model).__name__)
+        return model
+    if model_config.get("quantization") == "int8":
+        model = torch.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+        logger.debug("%s linear layers quantized to INT8.", type(model).__name__)
+        return model
+    if model_config.get("ipex", False):
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            logger.warning("ipex is set but intel_extension_for_pytorch is not installed.")
+            return model
+        model = ipex.optimize(model.eval(), dtype=model.dtype)
+        logger.debug("%s optimized with Intel Extension for PyTorch.", type(model).__name__)
+    return model
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 import re
 import torch
 from transformers import pipeline
+from src.parsers.stages.batching import wrap_pipeline
+from src.parsers.stages.optimization import optimize_for_inference
 from src.utils.error_handling import log_error
 from src.utils.config import Config
 
@@ -41,6 +43,10 @@ def initialize_summarization_pipeline(logger: logging.Logger, config: Dict[str,
             tokenizer=model_id,
             device=device
         )
+        summarization_pipeline.model = optimize_for_inference(
+            summarization_pipeline.model.eval(), logger, summarization_config, "cuda" if device == 0 else "cpu"
+        )
+        summarization_pipeline = wrap_pipeline(summarization_pipeline, logger, summarization_config.get('batching'))
         if prompt_template:
             logger.debug("Using prompt template for summarization: %s", prompt_template)
         logger.info("Summarization pipeline initialized successfully.")
@@ -128,14 +134,15 @@ def perform_summarization(email_content: str, summarization_pipeline: pipeline,
             logger.debug(f"Processing chunk {i}/{len(chunks)}")
             for attempt in range(summarization_config.max_retries):
                 try:
-                    summary = summarization_pipeline(
-                        chunk,
-                        max_length=summarization_config.max_summary_length,
-                        min_length=summarization_config.min_summary_length,
-                        do_sample=True,
-                        temperature=summarization_config.temperature,
-                        top_p=summarization_config.top_p,
-                    )
+                    with torch.inference_mode():
+                        summary = summarization_pipeline(
+                            chunk,
+                            max_length=summarization_config.max_summary_length,
+                            min_length=summarization_config.min_summary_length,
+                            do_sample=True,
+                            temperature=summarization_config.temperature,
+                            top_p=summarization_config.top_p,
+                        )
                     summaries.append(summary[0]['summary_text'])
                     break
                 except (KeyError, ImportError) as e:
@@ -147,14 +154,15 @@ def perform_summarization(email_content: str, summarization_pipeline: pipeline,
         if len(summaries) > 1 and summarization_config.recursive_summarization:
             logger.debug("Performing recursive summarization on combined chunk summaries.")
             combined_summary = " ".join(summaries)
-            final_summary = summarization_pipeline(
-                combined_summary,
-                max_length=summarization_config.max_summary_length,
-                min_length=summarization_config.min_summary_length,
-                do_sample=True,
-                temperature=summarization_config.temperature,
-                top_p=summarization_config.top_p,
-            )[0]['summary_text']
+            with torch.inference_mode():
+                final_summary = summarization_pipeline(
+                    combined_summary,
+                    max_length=summarization_config.max_summary_length,
+                    min_length=summarization_config.min_summary_length,
+                    do_sample=True,
+                    temperature=summarization_config.temperature,
+                    top_p=summarization_config.top_p,
+                )[0]['summary_text']
         else:
             final_summary = " ".join(summaries)
         logger.debug(f"Generated summary: {final_summary}")
@@ -5,6 +5,7 @@ import logging
 import re
 from src.utils.quickbase_schema import QUICKBASE_SCHEMA
 from src.utils.exceptions import ValidationError
+from src.utils.validation import compile_fast_validator, fastjsonschema
 from transformers import pipeline
 import torch
 
@@ -27,10 +28,17 @@ def extend_with_default(validator_class):
     return validators.extend(validator_class, {"properties": set_defaults})
 
 DefaultValidatingDraft7Validator = extend_with_default(Draft7Validator)
+_schema_validator = DefaultValidatingDraft7Validator(QUICKBASE_SCHEMA)
+_fast_validator = compile_fast_validator(QUICKBASE_SCHEMA)
 
 def validate_schema(parsed_data: dict) -> List[str]:
-    validator = DefaultValidatingDraft7Validator(QUICKBASE_SCHEMA)
-    errors = sorted(validator.iter_errors(parsed_data), key=lambda e: e.path)
+    if _fast_validator is not None:
+        try:
+            _fast_validator(parsed_data)
+            return []
+        except fastjsonschema.JsonSchemaException:
+            pass
+    errors = sorted(_schema_validator.iter_errors(parsed_data), key=lambda e: e.path)
     error_messages = []
     for error in errors:
         path = ".".join([str(elem) for elem in error.path])
@@ -8,6 +8,11 @@ from typing import Optional, Tuple, List, Dict, Any
 import torch
 import re
 
+try:
+    import fastjsonschema
+except ImportError:  # optional compiled fast path for schema validation
+    fastjsonschema = None
+
 from .quickbase_schema import QUICKBASE_SCHEMA
 from .exceptions import ValidationError
 
@@ -101,6 +106,21 @@ def extend_with_default(validator_class):
 
 DefaultValidatingDraft7Validator = extend_with_default(Draft7Validator)
 
+def compile_fast_validator(schema: dict):
+    """
+    Compile ``schema`` with fastjsonschema for a quick pass/fail check.
+
+    Returns None when fastjsonschema is unavailable or cannot compile the schema,
+    in which case callers go straight to the jsonschema validator.
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        return fastjsonschema.compile(schema)
+    except Exception as e:
+        logger.debug("fastjsonschema could not compile schema: %s", e)
+        return None
+
 assignment_schema = {
     "type": "object",
     "properties": {
@@ -313,6 +333,9 @@ assignment_schema = {
     },
 }
 
+_schema_validator = DefaultValidatingDraft7Validator(assignment_schema)
+_fast_validator = compile_fast_validator(assignment_schema)
+
 def validate_schema(parsed_data: dict) -> List[str]:
     """
     Validate parsed data against the JSON schema.
@@ -323,8 +346,16 @@ def validate_schema(parsed_data: dict) -> List[str]:
     Returns:
         List[str]: List of error messages.
     """
-    validator = DefaultValidatingDraft7Validator(assignment_schema)
-    errors = sorted(validator.iter_errors(parsed_data), key=lambda e: e.path)
+    # Valid documents are the common case: the compiled check confirms them
+    # without walking the schema. Only failures pay for jsonschema's full,
+    # all-errors report.
+    if _fast_validator is not None:
+        try:
+            _fast_validator(parsed_data)
+            return []
+        except fastjsonschema.JsonSchemaException:
+            pass
+    errors = sorted(_schema_validator.iter_errors(parsed_data), key=lambda e: e.path)
     error_messages = []
 
     for error in errors: